@@ -7,11 +7,14 @@ import mediapipe as mp
 from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
 import numpy as np
+import queue
+import threading
 import time
+from types import SimpleNamespace
 
-from exercises import EXERCISES
+from exercises import EXERCISES, ExerciseBase
 from pipeline import (
-    process_landmarks,
+    ProcessedLandmark,
     EMALandmarkSmoother,
     SwayTracker,
     Session,
@@ -19,6 +22,21 @@ from pipeline import (
     create_default_feedback_engine,
 )
 from pipeline.analytics import show_session_analytics
+from pipeline.kernels import scale_points, warmup as warmup_kernels
+from pipeline.scorer import warmup as warmup_scoring
+
+# Hoisted out of the capture loop. Note mp.Image cannot be preallocated and
+# reused: it copies the pixel data at construction rather than aliasing the
+# numpy buffer, so a cached instance would keep showing the first frame.
+_MP_SRGB = mp.ImageFormat.SRGB
+
+# Pre-bound cv2 constants and overlay colors: saves the module attribute
+# lookups and tuple construction inside the per-frame draw calls
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_LINE_AA = cv2.LINE_AA
+_WHITE = (255, 255, 255)
+_SKELETON_COLOR = (66, 117, 245)
+_JOINT_COLOR = (230, 66, 245)
 
 
 class App(ctk.CTk):
@@ -145,12 +163,45 @@ class App(ctk.CTk):
         )
         self.vid_label.pack(expand=True, fill="both")
 
+        # Latch the video area size from <Configure> events so the render
+        # tick never makes winfo_width/height Tk roundtrips
+        self._label_wh = (0, 0)
+        self.video_frame.bind("<Configure>", self._on_video_resize)
+
         # Camera and MediaPipe
         self.cap = None
         self.detector = None
-        self.current_exercise = EXERCISES[self.exercise_var.get()]
+        # Capture + inference run on a worker thread; the Tk loop only renders
+        # the most recent (frame, pose_result) pair from this size-1 queue.
+        self.frame_q = queue.Queue(maxsize=1)
+        # Newest result from the LIVE_STREAM detector callback
+        self._pose_q = queue.Queue(maxsize=1)
+        self.worker = None
+        self.stop_event = threading.Event()
+        # Monotonic timestamp base: detect_for_video needs strictly
+        # increasing timestamps, and wall-clock time can jump (NTP).
+        # Set once so timestamps stay monotonic across start/stop cycles.
+        self._ts0 = time.monotonic_ns()
+        self.current_exercise = EXERCISES[self.exercise_var.get()]()
         self.video_photo = None  # Will be a PIL.ImageTk.PhotoImage
         self.video_size = None   # (width, height) of the photo buffer
+        self._disp_buf = None    # Reused cv2.resize output buffer
+        # Reused pixel-coordinate buffer for skeleton drawing; no exercise
+        # renders more than a handful of keypoints
+        self._px_buf = np.empty((8, 2), dtype=np.int32)
+
+        # UI label cache: lets the tick skip Tk configure() calls when a
+        # label's text hasn't actually changed since the previous frame
+        self._ui_state = {}
+
+        # Overlay caches — re-stringify the angle only when it moves a
+        # full degree; the score lines are pre-rendered into a patch +
+        # mask when a new rep lands and masked-copied onto each frame
+        self._last_angle_int = None
+        self._last_angle_text = ""
+        self._overlay_scores = None
+        self._overlay_patch = None
+        self._overlay_mask = None
 
         # Pipeline components
         self.smoother = EMALandmarkSmoother(alpha=0.3)
@@ -164,11 +215,16 @@ class App(ctk.CTk):
         self.init_mediapipe()
 
     def init_mediapipe(self):
+        warmup_kernels()  # JIT-compile hot-path math before the first frame
+        warmup_scoring()  # likewise for the scalar scoring helpers
         try:
             base_options = python.BaseOptions(model_asset_path="pose_landmarker_lite.task")
+            # LIVE_STREAM lets MediaPipe overlap preprocessing of frame N+1
+            # with inference of frame N instead of blocking per call
             options = vision.PoseLandmarkerOptions(
                 base_options=base_options,
-                running_mode=vision.RunningMode.VIDEO,
+                running_mode=vision.RunningMode.LIVE_STREAM,
+                result_callback=self._on_pose_result,
                 output_segmentation_masks=False,
             )
             self.detector = vision.PoseLandmarker.create_from_options(options)
@@ -176,20 +232,31 @@ class App(ctk.CTk):
             print(f"Error loading MediaPipe model: {e}")
 
     def change_exercise(self, choice):
-        self.current_exercise = EXERCISES[choice]
+        self.current_exercise = EXERCISES[choice]()
         self.current_exercise.reset()
         self._reset_ui_labels()
 
+    def _on_video_resize(self, event):
+        """Record the new video area size and drop the stale resize buffer."""
+        self._label_wh = (event.width, event.height)
+        self._disp_buf = None
+
+    def _set_label(self, key, label, text):
+        """Update a label's text only when it changed since the last tick."""
+        if self._ui_state.get(key) != text:
+            self._ui_state[key] = text
+            label.configure(text=text)
+
     def _reset_ui_labels(self):
-        self.reps_label.configure(text="REPS: 0")
-        self.stage_label.configure(text="STAGE: -")
-        self.feedback_label.configure(text="")
-        self.final_score_label.configure(text="Final: --")
-        self.rom_score_label.configure(text="ROM: --")
-        self.stability_score_label.configure(text="Stability: --")
-        self.tempo_score_label.configure(text="Tempo: --")
-        self.session_avg_label.configure(text="Session Avg: --")
-        self.engine_feedback_label.configure(text="")
+        self._set_label("reps", self.reps_label, "REPS: 0")
+        self._set_label("stage", self.stage_label, "STAGE: -")
+        self._set_label("feedback", self.feedback_label, "")
+        self._set_label("final", self.final_score_label, "Final: --")
+        self._set_label("rom", self.rom_score_label, "ROM: --")
+        self._set_label("stability", self.stability_score_label, "Stability: --")
+        self._set_label("tempo", self.tempo_score_label, "Tempo: --")
+        self._set_label("session_avg", self.session_avg_label, "Session Avg: --")
+        self._set_label("engine_feedback", self.engine_feedback_label, "")
 
     def toggle_analysis(self):
         if not self.is_running:
@@ -198,8 +265,16 @@ class App(ctk.CTk):
                 self.vid_label.configure(text="Error: Cannot open camera")
                 return
 
+            # Ask for MJPEG before negotiating resolution: uncompressed YUYV
+            # caps USB bandwidth and frame rate, while MJPEG decodes through
+            # OpenCV's SIMD libjpeg-turbo path
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            # The landmarker-lite model downsamples internally anyway, so
+            # capturing above 640x480 only inflates the O(HW) cvtColor and
+            # preprocessing cost; pin 30 fps to keep delivery predictable.
+            self.cap.set(cv2.CAP_PROP_FPS, 30)
 
             self.is_running = True
             self.start_btn.configure(text="Stop Analysis", fg_color="red", hover_color="darkred")
@@ -208,11 +283,21 @@ class App(ctk.CTk):
             self.sway_tracker.reset()
             self.session = Session(exercise_name=self.exercise_var.get())
             self._reset_ui_labels()
+
+            self.stop_event.clear()
+            self.worker = threading.Thread(target=self._capture_loop, daemon=True)
+            self.worker.start()
             self.update_frame()
         else:
             self.is_running = False
-            if self.cap:
-                self.cap.release()
+            self.stop_event.set()  # Worker releases the capture on exit
+            if self.worker is not None:
+                # Wait out the worker's final iteration before touching the
+                # session: a rep completing during shutdown must land before
+                # summary()/save(), and the camera must be released before a
+                # quick restart reopens it.
+                self.worker.join(timeout=2.0)
+                self.worker = None
             self.start_btn.configure(
                 text="Start Analysis",
                 fg_color=["#3B8ED0", "#1F6AA5"],
@@ -226,8 +311,12 @@ class App(ctk.CTk):
             if self.session:
                 self.session.end_session()
                 summary = self.session.summary()
-                self.session_avg_label.configure(
-                    text=f"Session Avg: {summary['avg_final_score']}"
+                # Through _set_label so the change-detection cache stays
+                # in sync; a direct configure() here would make the next
+                # _reset_ui_labels skip this label.
+                self._set_label(
+                    "session_avg", self.session_avg_label,
+                    f"Session Avg: {summary['avg_final_score']}",
                 )
                 # Save session
                 ts = int(time.time())
@@ -239,132 +328,332 @@ class App(ctk.CTk):
                 self.progression.save("progression_state.json")
 
                 if prog["action"] != "none":
-                    self.engine_feedback_label.configure(
-                        text=f"Progression: {prog['action'].upper()} — {prog['reason']}"
+                    self._set_label(
+                        "engine_feedback", self.engine_feedback_label,
+                        f"Progression: {prog['action'].upper()} — {prog['reason']}",
                     )
 
                 # Show analytics dashboard
                 show_session_analytics(self.session)
 
-    def update_frame(self):
-        if not self.is_running:
-            return
-
-        ret, frame = self.cap.read()
-        if ret:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
-            frame_timestamp_ms = int(time.time() * 1000)
-
-            annotated_image = frame.copy()
+    # Run the heavy pose detector only every Nth captured frame; in between,
+    # landmarks are propagated forward using their last observed velocity.
+    # Rep thresholds are coarse, so extrapolated frames cannot flip a
+    # transition; 2 keeps worst-case landmark age at one camera interval,
+    # 3 trades a little accuracy for more headroom on slow machines.
+    DETECT_EVERY = 2
+
+    # Motion gate for detect_async. Frames are compared as 80x60 grayscale
+    # thumbnails; when the mean absolute luma difference between consecutive
+    # frames stays below the threshold the subject is effectively stationary
+    # (e.g. resting between reps), the last landmarks are reused and the
+    # detector is not invoked at all. LIVE_STREAM mode with monotonically
+    # increasing timestamps keeps the internal tracker warm across the gap.
+    MOTION_SIZE = (80, 60)
+    MOTION_THRESHOLD = 1.5
+
+    # Tk repaint period (ms). Deliberately independent of camera/detector
+    # cadence: the worker produces at its own pace and the UI just shows
+    # the newest result, keeping redraws smooth when detection is slow.
+    UI_TICK_MS = 15
+
+    @staticmethod
+    def _put_latest(q, item):
+        """Put item into a size-1 queue, evicting the stale entry if full."""
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                pass
 
+    def _on_pose_result(self, result, output_image, timestamp_ms):
+        """LIVE_STREAM callback: hand the newest detection to the worker."""
+        self._put_latest(self._pose_q, result)
+
+    def _capture_loop(self):
+        """Worker thread: reads frames and runs pose inference off the Tk loop.
+
+        The newest (frame, pose_result) pair is kept in a size-1 queue with
+        drop-oldest semantics so the renderer never falls behind the camera.
+        """
+        tick = 0
+        last_lm = None  # (33, 3) array from the most recent detection
+        lm_vel = None   # per-frame landmark velocity between detections
+        # Ring of preallocated RGB destination buffers. cvtColor writes
+        # into them in place, so no H*W*3 allocation happens per frame.
+        # Three buffers because one may sit in the queue and one may be
+        # held by the renderer while the worker converts the next frame.
+        rgb_bufs = None
+        buf_i = 0
+        # Reused thumbnails for the motion gate (see MOTION_THRESHOLD)
+        luma = np.empty((self.MOTION_SIZE[1], self.MOTION_SIZE[0]), dtype=np.uint8)
+        prev_luma = np.empty_like(luma)
+        luma_diff = np.empty_like(luma)
+        have_prev_luma = False
+
+        while not self.stop_event.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                continue
+
+            # Single BGR->RGB pass: the same buffer feeds MediaPipe, the
+            # overlay drawing, and PIL. The BGR pixels are never needed.
+            if rgb_bufs is None or rgb_bufs[0].shape != frame.shape:
+                rgb_bufs = [np.empty_like(frame) for _ in range(3)]
+            rgb_frame = rgb_bufs[buf_i]
+            buf_i = (buf_i + 1) % 3
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+
+            # Motion gate: downscale first so the grayscale conversion and
+            # absdiff run on 80x60 pixels, not the full frame. Only gate
+            # once landmarks exist to reuse — the first detection must
+            # always go through.
+            small = cv2.resize(frame, self.MOTION_SIZE, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=luma)
+            stationary = False
+            if have_prev_luma and last_lm is not None:
+                cv2.absdiff(luma, prev_luma, dst=luma_diff)
+                stationary = cv2.mean(luma_diff)[0] < self.MOTION_THRESHOLD
+            luma, prev_luma = prev_luma, luma
+            have_prev_luma = True
+
+            if tick % self.DETECT_EVERY == 0 and not stationary:
+                mp_image = mp.Image(image_format=_MP_SRGB, data=rgb_frame)
+                frame_timestamp_ms = (time.monotonic_ns() - self._ts0) // 1_000_000
+                try:
+                    self.detector.detect_async(mp_image, frame_timestamp_ms)
+                except RuntimeError:
+                    # MediaPipe raises RuntimeError when the graph is
+                    # already closed (shutdown race with stop_event) or a
+                    # timestamp is rejected. Anything else is a real bug
+                    # and should surface, not be swallowed.
+                    pass
+
+            # Consume the newest async detection if one has landed
             try:
-                pose_result = self.detector.detect_for_video(mp_image, frame_timestamp_ms)
+                pose_result = self._pose_q.get_nowait()
+            except queue.Empty:
+                pose_result = None
 
+            if pose_result is not None:
                 if (
-                    pose_result
-                    and getattr(pose_result, "pose_landmarks", None)
+                    getattr(pose_result, "pose_landmarks", None)
                     and len(pose_result.pose_landmarks) > 0
                 ):
-                    raw_landmarks = pose_result.pose_landmarks[0]
-
-                    # Pipeline Step 1: Smooth raw landmarks
-                    smoothed = self.smoother.smooth(raw_landmarks)
-
-                    # Pipeline Step 2: Compute hip center for sway tracking
-                    hip_center_x = (smoothed[23].x + smoothed[24].x) / 2.0
-                    current_sway = self.sway_tracker.update(hip_center_x)
-
-                    # Pipeline Step 3: Exercise FSM processing
-                    counter, stage, feedback, render_data = self.current_exercise.process(smoothed)
-
-                    # Pipeline Step 3.5: Feed frame to ML scorers
-                    if render_data.get("angle", 0) != 0:
-                        self.current_exercise.record_ml_frame(render_data["angle"], smoothed)
-
-                    # Pipeline Step 4: Feedback engine evaluation
-                    context = {
-                        "sway": current_sway,
-                        "current_rom": self.current_exercise.rom_tracker.current_max - self.current_exercise.rom_tracker.current_min
-                        if self.current_exercise.rom_tracker.current_max > -float('inf') else 0,
-                        "target_rom": self.current_exercise.config.target_rom,
-                        "ideal_rep_time": self.current_exercise.config.ideal_rep_time,
-                    }
-                    engine_feedback = self.feedback_engine.evaluate(smoothed, context)
-
-                    # Pipeline Step 5: If rep was just completed, record it into session
-                    if self.current_exercise.rep_completed and self.current_exercise.last_rep_scores:
-                        scores = self.current_exercise.last_rep_scores
-                        self.session.add_rep(
-                            scores=scores,
-                            rom_value=self.current_exercise.rom_tracker.average_rom,
-                            rep_time=self.current_exercise.tempo_tracker.average_tempo,
-                            feedback=engine_feedback,
-                        )
+                    cur = np.array(
+                        [[lm.x, lm.y, lm.z] for lm in pose_result.pose_landmarks[0]]
+                    )
+                    if last_lm is not None and last_lm.shape == cur.shape:
+                        lm_vel = (cur - last_lm) / self.DETECT_EVERY
+                    last_lm = cur
+                else:
+                    # Pose lost — don't extrapolate stale landmarks
+                    last_lm = None
+                    lm_vel = None
+            elif last_lm is not None:
+                # No fresh detection — advance cached landmarks one step.
+                # On gated (stationary) frames the pose has not moved, so
+                # reuse them as-is rather than drifting on stale velocity.
+                if lm_vel is not None and not stationary:
+                    last_lm = last_lm + lm_vel
+                synthesized = [
+                    ProcessedLandmark(
+                        x=float(p[0]), y=float(p[1]), z=float(p[2]), visibility=1.0
+                    )
+                    for p in last_lm
+                ]
+                pose_result = SimpleNamespace(pose_landmarks=[synthesized])
+
+            # Run the scoring pipeline here so the Tk loop never pays for it
+            payload = None
+            if (
+                pose_result
+                and getattr(pose_result, "pose_landmarks", None)
+                and len(pose_result.pose_landmarks) > 0
+            ):
+                payload = self._process_pose(pose_result.pose_landmarks[0])
+
+            tick += 1
+            self._put_latest(self.frame_q, (rgb_frame, payload))
+
+        self.cap.release()
+
+    def _process_pose(self, raw_landmarks):
+        """Run the per-frame scoring pipeline on the worker thread.
+
+        Returns a small payload dict for the renderer, which only needs to
+        update labels and draw overlays on the Tk main loop.
+        """
+        # Pipeline Step 1: Smooth raw landmarks
+        smoothed = self.smoother.smooth(raw_landmarks)
+        # SoA view of the smoothed coordinates: exercises index rows of this
+        # buffer instead of doing per-landmark attribute access.
+        xy = self.smoother.state[:, :2]
+
+        # Pipeline Step 2: Compute hip center for sway tracking
+        hip_center_x = (xy[23, 0] + xy[24, 0]) / 2.0
+        current_sway = self.sway_tracker.update(hip_center_x)
+
+        # Pipeline Step 3: Exercise FSM processing
+        counter, stage, feedback, render_data = self.current_exercise.process(smoothed, xy)
+
+        # Pipeline Step 3.5: Feed frame to ML scorers
+        if render_data.get("angle", 0) != 0:
+            self.current_exercise.record_ml_frame(render_data["angle"], smoothed)
+
+        # Pipeline Step 4: Feedback engine evaluation
+        context = {
+            "sway": current_sway,
+            "current_rom": self.current_exercise.rom_tracker.current_max - self.current_exercise.rom_tracker.current_min
+            if self.current_exercise.rom_tracker.current_max > -float('inf') else 0,
+            "target_rom": self.current_exercise.config.target_rom,
+            "ideal_rep_time": self.current_exercise.config.ideal_rep_time,
+        }
+        engine_feedback = self.feedback_engine.evaluate(smoothed, context)
+
+        # Pipeline Step 5: If rep was just completed, record it into session
+        rep_scores = None
+        if self.current_exercise.rep_completed and self.current_exercise.last_rep_scores:
+            rep_scores = self.current_exercise.last_rep_scores
+            self.session.add_rep(
+                scores=rep_scores,
+                rom_value=self.current_exercise.rom_tracker.average_rom,
+                rep_time=self.current_exercise.tempo_tracker.average_tempo,
+                feedback=engine_feedback,
+            )
 
-                        # Update score UI
-                        lstm_score = scores.get("lstm_final", "--")
-                        trans_score = scores.get("transformer_final", "--")
-                        self.final_score_label.configure(text=f"Rule: {scores['final_score']} | LSTM: {lstm_score} | TF: {trans_score}")
-                        self.rom_score_label.configure(text=f"ROM: {scores['rom_score']}")
-                        self.stability_score_label.configure(text=f"Stability: {scores['stability_score']}")
-                        self.tempo_score_label.configure(text=f"Tempo: {scores['tempo_score']}")
-                        self.session_avg_label.configure(
-                            text=f"Session Avg: {round(self.session.avg_final_score, 1)}"
-                        )
+        return {
+            "counter": counter,
+            "stage": ExerciseBase.stage_name(stage),
+            "feedback": feedback,
+            "engine_feedback": engine_feedback,
+            "render_data": render_data,
+            "rep_scores": rep_scores,  # non-None only when a rep just finished
+            "last_rep_scores": self.current_exercise.last_rep_scores,
+            "session_avg": self.session.avg_final_score,
+        }
 
-                    # Update basic labels
-                    self.reps_label.configure(text=f"REPS: {counter}")
-                    self.stage_label.configure(text=f"STAGE: {stage if stage else '-'}")
-                    self.feedback_label.configure(text=feedback)
+    def update_frame(self):
+        if not self.is_running:
+            return
 
-                    if engine_feedback:
-                        self.engine_feedback_label.configure(text=engine_feedback[0])
+        try:
+            frame, payload = self.frame_q.get_nowait()
+        except queue.Empty:
+            frame, payload = None, None
+
+        if frame is not None:
+            # The worker hands over a fresh RGB buffer each tick, so overlays
+            # can be drawn straight onto it — no defensive copy needed.
+            annotated_image = frame
+
+            if payload is not None:
+                render_data = payload["render_data"]
+
+                # Update score UI when a rep just completed
+                scores = payload["rep_scores"]
+                if scores is not None:
+                    lstm_score = scores.get("lstm_final", "--")
+                    trans_score = scores.get("transformer_final", "--")
+                    self._set_label("final", self.final_score_label, f"Rule: {scores['final_score']} | LSTM: {lstm_score} | TF: {trans_score}")
+                    self._set_label("rom", self.rom_score_label, f"ROM: {scores['rom_score']}")
+                    self._set_label("stability", self.stability_score_label, f"Stability: {scores['stability_score']}")
+                    self._set_label("tempo", self.tempo_score_label, f"Tempo: {scores['tempo_score']}")
+                    self._set_label(
+                        "session_avg", self.session_avg_label,
+                        f"Session Avg: {round(payload['session_avg'], 1)}",
+                    )
 
-                    # ====== Draw Skeleton ======
-                    points = render_data["points"]
-                    h, w, _ = annotated_image.shape
+                # Update basic labels
+                self._set_label("reps", self.reps_label, f"REPS: {payload['counter']}")
+                stage = payload["stage"]
+                self._set_label("stage", self.stage_label, f"STAGE: {stage if stage else '-'}")
+                self._set_label("feedback", self.feedback_label, payload["feedback"])
+
+                if payload["engine_feedback"]:
+                    self._set_label("engine_feedback", self.engine_feedback_label, payload["engine_feedback"][0])
+
+                # ====== Draw Skeleton ======
+                h, w, _ = annotated_image.shape
+
+                # Exercises provide keypoints as an (N, 2) float32 array;
+                # the compiled kernel scales them into a reused int32 buffer
+                xy = render_data["xy"]
+                px = self._px_buf[:len(xy)]
+                scale_points(xy, w, h, px)
+
+                if render_data.get("angle", 0) != 0 and len(px) >= 2:
+                    angle_int = int(render_data["angle"])
+                    if angle_int != self._last_angle_int:
+                        self._last_angle_int = angle_int
+                        self._last_angle_text = str(angle_int)
+                    cv2.putText(
+                        annotated_image, self._last_angle_text,
+                        tuple(px[1]), _FONT, 0.7, _WHITE, 2, _LINE_AA,
+                    )
 
-                    if render_data.get("angle", 0) != 0 and len(points) >= 2:
-                        mid_px = tuple(np.multiply([points[1].x, points[1].y], [w, h]).astype(int))
-                        cv2.putText(
-                            annotated_image, str(int(render_data["angle"])),
-                            mid_px, cv2.FONT_HERSHEY_SIMPLEX, 0.7,
-                            (255, 255, 255), 2, cv2.LINE_AA,
+                # One polyline call replaces the per-segment cv2.line loop
+                cv2.polylines(annotated_image, [px.reshape(-1, 1, 2)], False, _SKELETON_COLOR, 4)
+
+                for x, y in px:
+                    cv2.circle(annotated_image, (int(x), int(y)), 6, _JOINT_COLOR, cv2.FILLED)
+                    cv2.circle(annotated_image, (int(x), int(y)), 8, _WHITE, 2)
+
+                # Draw score overlay on video feed. The three text lines
+                # only change when a rep completes, so they are rendered
+                # once per rep into a small patch + mask and blitted with
+                # a masked copy each frame instead of three putText calls.
+                scores = payload["last_rep_scores"]
+                if scores:
+                    if scores is not self._overlay_scores:
+                        self._overlay_scores = scores
+                        lines = (
+                            (f"Rule: {scores['final_score']}", (0, 255, 0)),
+                            (f"LSTM: {scores.get('lstm_final', '--')}", (0, 200, 255)),
+                            (f"TF:   {scores.get('transformer_final', '--')}", (255, 200, 0)),
                         )
+                        patch = np.zeros((100, 200, 3), dtype=np.uint8)
+                        for row, (text, color) in enumerate(lines):
+                            cv2.putText(
+                                patch, text, (0, 30 * (row + 1)),
+                                _FONT, 0.8, color, 2, _LINE_AA,
+                            )
+                        self._overlay_patch = patch
+                        self._overlay_mask = patch.any(axis=2, keepdims=True)
+                    np.copyto(
+                        annotated_image[0:100, w - 200:w],
+                        self._overlay_patch,
+                        where=self._overlay_mask,
+                    )
 
-                    for i in range(len(points) - 1):
-                        p1 = tuple(np.multiply([points[i].x, points[i].y], [w, h]).astype(int))
-                        p2 = tuple(np.multiply([points[i + 1].x, points[i + 1].y], [w, h]).astype(int))
-                        cv2.line(annotated_image, p1, p2, (245, 117, 66), 4)
-
-                    for p in points:
-                        px = tuple(np.multiply([p.x, p.y], [w, h]).astype(int))
-                        cv2.circle(annotated_image, px, 6, (245, 66, 230), cv2.FILLED)
-                        cv2.circle(annotated_image, px, 8, (255, 255, 255), 2)
-
-                    # Draw score overlay on video feed
-                    if self.current_exercise.last_rep_scores:
-                        scores = self.current_exercise.last_rep_scores
-                        score_text = f"Rule: {scores['final_score']}"
-                        lstm_text  = f"LSTM: {scores.get('lstm_final', '--')}"
-                        trans_text = f"TF:   {scores.get('transformer_final', '--')}"
-                        
-                        cv2.putText(annotated_image, score_text, (w - 200, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2, cv2.LINE_AA)
-                        cv2.putText(annotated_image, lstm_text,  (w - 200, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 200, 0), 2, cv2.LINE_AA)
-                        cv2.putText(annotated_image, trans_text, (w - 200, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 200, 255), 2, cv2.LINE_AA)
-
-            except Exception as e:
-                pass
 
-            # Convert to tkinter-compatible image
-            image_rgb = cv2.cvtColor(annotated_image, cv2.COLOR_BGR2RGB)
-            pil_img = PIL.Image.fromarray(image_rgb)
+            label_w, label_h = self._label_wh
+            frame_h, frame_w = annotated_image.shape[:2]
+            # Resize only when the label size actually differs from the frame
+            if label_w > 10 and label_h > 10 and (label_w, label_h) != (frame_w, frame_h):
+                # SIMD-backed OpenCV resize into a reused buffer; INTER_AREA
+                # is plenty for display quality and much cheaper than LANCZOS
+                if self._disp_buf is None or self._disp_buf.shape[:2] != (label_h, label_w):
+                    self._disp_buf = np.empty((label_h, label_w, 3), dtype=np.uint8)
+                cv2.resize(
+                    annotated_image, (label_w, label_h),
+                    dst=self._disp_buf, interpolation=cv2.INTER_AREA,
+                )
+                disp = self._disp_buf
+            else:
+                disp = annotated_image
 
-            label_w = self.video_frame.winfo_width()
-            label_h = self.video_frame.winfo_height()
-            if label_w > 10 and label_h > 10:
-                pil_img = pil_img.resize((label_w, label_h), PIL.Image.LANCZOS)
+            # Zero-copy wrap of the RGB buffer for tkinter display
+            disp_h, disp_w = disp.shape[:2]
+            pil_img = PIL.Image.frombuffer(
+                "RGB", (disp_w, disp_h), disp, "raw", "RGB", 0, 1
+            )
 
             new_size = pil_img.size
             # Reuse photo buffer via .paste() when size matches; recreate only on resize
@@ -376,12 +665,13 @@ class App(ctk.CTk):
                 self.video_photo.paste(pil_img)
 
         if self.is_running:
-            self.after(30, self.update_frame)
+            self.after(self.UI_TICK_MS, self.update_frame)
 
     def on_closing(self):
         self.is_running = False
-        if self.cap:
-            self.cap.release()
+        self.stop_event.set()
+        if self.worker is not None:
+            self.worker.join(timeout=2.0)
         try:
             self.destroy()
         except:
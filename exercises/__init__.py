@@ -1,3 +1,4 @@
+from .base import ExerciseBase
 from .squats import Squats
 from .sit_to_stand import SitToStand
 from .marching import Marching
@@ -9,15 +10,18 @@ from .heel_raises import HeelRaises
 from .forward_arm_raises import ForwardArmRaises
 from .side_arm_raises import SideArmRaises
 
+# Classes, not instances: each exercise owns a RepScorer and several
+# trackers, so eager construction at import time costs latency and memory
+# for exercises that may never be selected. The app instantiates on demand.
 EXERCISES = {
-    "Squats": Squats(),
-    "Sit-to-Stand": SitToStand(),
-    "Marching": Marching(),
-    "Leg Raises": LegRaises(),
-    "Wall Push-ups": WallPushups(),
-    "Standing Hip Abduction": StandingHipAbduction(),
-    "Standing Hip Extension": StandingHipExtension(),
-    "Heel Raises": HeelRaises(),
-    "Forward Arm Raises": ForwardArmRaises(),
-    "Side Arm Raises": SideArmRaises()
+    "Squats": Squats,
+    "Sit-to-Stand": SitToStand,
+    "Marching": Marching,
+    "Leg Raises": LegRaises,
+    "Wall Push-ups": WallPushups,
+    "Standing Hip Abduction": StandingHipAbduction,
+    "Standing Hip Extension": StandingHipExtension,
+    "Heel Raises": HeelRaises,
+    "Forward Arm Raises": ForwardArmRaises,
+    "Side Arm Raises": SideArmRaises,
 }
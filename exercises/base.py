@@ -6,15 +6,130 @@ Each exercise inherits from this and provides:
 - Feedback rules
 """
 
-import numpy as np
-from pipeline.scorer import ExerciseConfig, RepScorer
+import operator
+import textwrap
+
+from pipeline.kernels import angle_fsm_step
+from pipeline.scorer import ExerciseConfig, score_rep
 from pipeline.feature_engine import (
-    calculate_angle_2d,
+    calculate_angle_series,
     ROMTracker,
     TempoTracker,
 )
 
 
+# Stage codes: small ints so the per-frame FSM compares go through fast
+# int equality instead of string comparison. Codes start at 1 so a set
+# stage is always truthy; stage_name() maps back for display.
+STAGE_UP = 1
+STAGE_DOWN = 2
+STAGE_SEATED = 3
+STAGE_STANDING = 4
+STAGE_LEFT_LIFTED = 5
+STAGE_RIGHT_LIFTED = 6
+
+_STAGE_NAMES = {
+    STAGE_UP: "up",
+    STAGE_DOWN: "down",
+    STAGE_SEATED: "seated",
+    STAGE_STANDING: "standing",
+    STAGE_LEFT_LIFTED: "left lifted",
+    STAGE_RIGHT_LIFTED: "right lifted",
+}
+
+_ANGLE_PROCESS_TEMPLATE = """\
+def process(self, landmarks, xy):
+    was_armed = self.stage == {rest_stage!r}
+    angle, armed, fired = angle_fsm_step(
+        xy[{i}, 0], xy[{i}, 1], xy[{j}, 0], xy[{j}, 1], xy[{k}, 0], xy[{k}, 1],
+        {rest_gt!r}, {rest_thr}, {rep_gt!r}, {rep_thr}, was_armed)
+    self.rom_tracker.update(angle)
+    self.rep_completed = False
+    if fired:
+        self.stage = {rep_stage!r}
+        self.counter += 1
+        self._on_rep_complete()
+        self.feedback = self._rep_feedback
+    elif armed and not was_armed:
+        self._on_rep_start()
+        self.stage = {rest_stage!r}
+        self.feedback = self._FB_CUE
+    return self.counter, self.stage, self.feedback, self._render_data(angle, xy)
+"""
+
+# Trig-free twin of the process() template for callers that already
+# have the joint angle (process_batch precomputes the whole series in
+# one vectorized call). Same FSM step as angle_fsm_step, inlined.
+_ANGLE_STEP_TEMPLATE = """\
+def process_angle(self, angle, xy):
+    was_armed = self.stage == {rest_stage!r}
+    armed = was_armed or angle {rest_op} {rest_thr}
+    self.rom_tracker.update(angle)
+    self.rep_completed = False
+    if armed and angle {rep_op} {rep_thr}:
+        self.stage = {rep_stage!r}
+        self.counter += 1
+        self._on_rep_complete()
+        self.feedback = self._rep_feedback
+    elif armed and not was_armed:
+        self._on_rep_start()
+        self.stage = {rest_stage!r}
+        self.feedback = self._FB_CUE
+    return self.counter, self.stage, self.feedback, self._render_data(angle, xy)
+"""
+
+
+def _make_angle_process(triplet, transitions):
+    """
+    Generate a specialized process() for a triplet-plus-thresholds
+    exercise, with landmark indices, thresholds and stage codes inlined
+    as literals. The numeric core (angle plus both threshold checks)
+    runs in the jitted angle_fsm_step kernel; the generated Python body
+    only reacts to the arm/fire flags it returns. Also generates
+    process_angle(), the same FSM step taking a precomputed angle.
+    Returns (process, process_angle).
+    """
+    (rest_cmp, rest_thr, rest_stage), (rep_cmp, rep_thr, rep_stage) = transitions
+    i, j, k = triplet
+    src = _ANGLE_PROCESS_TEMPLATE.format(
+        i=i, j=j, k=k,
+        rest_gt=rest_cmp is operator.gt, rest_thr=rest_thr, rest_stage=rest_stage,
+        rep_gt=rep_cmp is operator.gt, rep_thr=rep_thr, rep_stage=rep_stage,
+    )
+    step_src = _ANGLE_STEP_TEMPLATE.format(
+        rest_op='>' if rest_cmp is operator.gt else '<',
+        rest_thr=rest_thr, rest_stage=rest_stage,
+        rep_op='>' if rep_cmp is operator.gt else '<',
+        rep_thr=rep_thr, rep_stage=rep_stage,
+    )
+    namespace = {"angle_fsm_step": angle_fsm_step}
+    exec(compile(textwrap.dedent(src), "<angle-exercise>", "exec"), namespace)
+    exec(compile(textwrap.dedent(step_src), "<angle-exercise>", "exec"), namespace)
+    return namespace["process"], namespace["process_angle"]
+
+
+class RenderData:
+    """
+    Per-frame render payload reused across frames.
+
+    One instance lives on each exercise and has its two fields
+    overwritten in place, instead of allocating a fresh dict every
+    frame at 30 fps. get()/[] shims keep dict-style consumers working.
+    """
+
+    __slots__ = ('angle', 'xy')
+
+    def __init__(self):
+        self.angle = 0.0
+        self.xy = None
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
 class ExerciseBase:
     """
     Base class for all exercises.
@@ -23,6 +138,27 @@ class ExerciseBase:
     And should set self.config to an ExerciseConfig instance.
     """
 
+    # Fixed attribute layout: exercises are created per selection and
+    # touched every frame, so skipping the per-instance __dict__ keeps
+    # them compact. Subclasses declare their own (usually empty) slots.
+    __slots__ = (
+        'counter', 'stage', 'feedback', 'relevant_landmarks',
+        'config', 'rom_tracker', 'tempo_tracker',
+        'last_rep_scores', 'rep_completed', '_rep_feedback', '_render',
+        'ml_lstm', 'ml_transformer',
+    )
+
+    # Subclasses that set _ANGLE_TRIPLET get a specialized process()
+    # generated from their _TRANSITIONS table at class-creation time.
+    _ANGLE_TRIPLET = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._ANGLE_TRIPLET is not None and "process" not in cls.__dict__:
+            cls.process, cls.process_angle = _make_angle_process(
+                cls._ANGLE_TRIPLET, cls._TRANSITIONS
+            )
+
     def __init__(self):
         self.counter = 0
         self.stage = None
@@ -31,15 +167,23 @@ class ExerciseBase:
 
         # Scoring Config (override in subclasses)
         self.config = ExerciseConfig()
-        self.scorer = RepScorer(self.config)
 
         # Feature trackers
         self.rom_tracker = ROMTracker()
         self.tempo_tracker = TempoTracker()
 
+        # Reused render payload; _render_data overwrites it in place
+        self._render = RenderData()
+
         # Latest rep scores
         self.last_rep_scores = None
         self.rep_completed = False  # Flag for the UI to detect new rep
+        self._rep_feedback = ""  # Preformatted "Rep done!" line for this rep
+
+    @staticmethod
+    def stage_name(code):
+        """Display name for a stage code (None stays None)."""
+        return _STAGE_NAMES.get(code)
 
     def reset(self):
         self.counter = 0
@@ -47,6 +191,7 @@ class ExerciseBase:
         self.feedback = ""
         self.last_rep_scores = None
         self.rep_completed = False
+        self._rep_feedback = ""
         self.rom_tracker.reset()
         self.tempo_tracker.reset()
         
@@ -101,7 +246,8 @@ class ExerciseBase:
         rom = self.rom_tracker.complete_rep()
         rep_time = self.tempo_tracker.complete_rep()
 
-        self.last_rep_scores = self.scorer.score_rep(
+        self.last_rep_scores = score_rep(
+            self.config,
             user_rom=rom,
             sway=sway,
             rep_time=rep_time,
@@ -115,6 +261,10 @@ class ExerciseBase:
             self.last_rep_scores["lstm_final"] = lstm_scores["final_score"]
             self.last_rep_scores["transformer_final"] = trans_scores["final_score"]
 
+        # Format the rep-done line once here rather than on every frame
+        # that reads it (%-formatting beats an f-string for one value).
+        self._rep_feedback = "Rep done! Score: %s" % self.last_rep_scores['final_score']
+
         self.rep_completed = True
 
     def _on_rep_start(self):
@@ -122,9 +272,75 @@ class ExerciseBase:
         if self.tempo_tracker.rep_start_time is None:
             self.tempo_tracker.start_rep()
 
-    def process(self, landmarks):
+    def _advance(self, value):
+        """
+        Walk this exercise's transition table for one frame.
+
+        _TRANSITIONS declares two (cmp, threshold, stage) rows: the
+        first re-arms the rep at the rest position, the second fires
+        the rep once the value crosses the work threshold while armed.
+        Subclasses state their FSM declaratively instead of repeating
+        the nested-if walk in every process().
+        """
+        rest_cmp, rest_thr, rest_stage = self._TRANSITIONS[0]
+        if rest_cmp(value, rest_thr):
+            self._on_rep_start()
+            self.stage = rest_stage
+            self.feedback = self._FB_CUE
+        rep_cmp, rep_thr, rep_stage = self._TRANSITIONS[1]
+        if self.stage == rest_stage and rep_cmp(value, rep_thr):
+            self.stage = rep_stage
+            self.counter += 1
+            self._on_rep_complete()
+            self.feedback = self._rep_feedback
+
+    def process_batch(self, xy_seq):
         """
-        Process landmarks for a single frame.
+        Score a prerecorded (T, 33, 2) landmark tensor.
+
+        For triplet-based exercises the full angle time series is
+        computed with a single vectorized call, and the per-frame loop
+        walks process_angle — the generated trig-free twin of
+        process() — so no per-frame angle math remains. Returns the
+        list of per-frame process() results.
+        """
+        # Deferred: the live per-frame path in this module is pure
+        # scalar Python; only offline batch scoring touches NumPy.
+        import numpy as np
+
+        xy_seq = np.asarray(xy_seq)
+        if self._ANGLE_TRIPLET is not None:
+            angles = calculate_angle_series(xy_seq, *self._ANGLE_TRIPLET)
+            # tolist() boxes the whole series in one C loop
+            return [
+                self.process_angle(a, xy)
+                for a, xy in zip(angles.tolist(), xy_seq)
+            ]
+        return [self.process(None, xy_seq[t]) for t in range(xy_seq.shape[0])]
+
+    def _render_data(self, angle, xy):
+        """
+        Fill and return the reused render payload.
+        Selects this exercise's relevant landmark rows from the shared
+        (33, 2) coordinate buffer so the drawing code can scale all
+        keypoints in one vectorized pass.
+        """
+        r = self._render
+        r.angle = angle
+        r.xy = xy[self.relevant_landmarks]
+        return r
+
+    def process(self, landmarks, xy):
+        """
+        Process a single frame.
+
+        Args:
+            landmarks: Smoothed landmark objects (for rules that need
+                       visibility or z).
+            xy: (33, 2) float array of landmark x/y coordinates — the
+                SoA buffer exercises index instead of doing per-landmark
+                attribute access.
+
         Returns (counter, stage, feedback, render_data).
         """
         raise NotImplementedError("Subclasses must implement process()")
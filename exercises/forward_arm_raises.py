@@ -1,9 +1,18 @@
-from .base import ExerciseBase
+import operator
+import sys
+
+from .base import ExerciseBase, STAGE_DOWN, STAGE_UP
 from pipeline.scorer import ExerciseConfig
-from pipeline.feature_engine import calculate_angle_2d
 
 
 class ForwardArmRaises(ExerciseBase):
+    _FB_CUE = sys.intern("Raise arms forward")
+
+    _ANGLE_TRIPLET = (23, 11, 13)
+    _TRANSITIONS = ((operator.lt, 30.0, STAGE_DOWN), (operator.gt, 45.0, STAGE_UP))
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [23, 11, 13]
@@ -15,25 +24,4 @@ class ForwardArmRaises(ExerciseBase):
             weight_stability=0.25,
             weight_tempo=0.3,
         )
-        self.scorer.config = self.config
-
-    def process(self, landmarks):
-        hip = landmarks[23]
-        shoulder = landmarks[11]
-        elbow = landmarks[13]
-
-        angle = calculate_angle_2d(hip, shoulder, elbow)
-        self.rom_tracker.update(angle)
-        self.rep_completed = False
-
-        if angle < 30:
-            self._on_rep_start()
-            self.stage = "down"
-            self.feedback = "Raise arms forward"
-        if angle > 45 and self.stage == "down":  # Low threshold: even small raises count
-            self.stage = "up"
-            self.counter += 1
-            self._on_rep_complete()
-            self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
 
-        return self.counter, self.stage, self.feedback, {"angle": angle, "points": [hip, shoulder, elbow]}
@@ -1,8 +1,17 @@
-from .base import ExerciseBase
+import operator
+import sys
+
+from .base import ExerciseBase, STAGE_DOWN, STAGE_UP
 from pipeline.scorer import ExerciseConfig
 
 
 class HeelRaises(ExerciseBase):
+    _FB_CUE = sys.intern("Raise heels slowly")
+
+    _TRANSITIONS = ((operator.lt, 0.02, STAGE_DOWN), (operator.gt, 0.03, STAGE_UP))
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [27, 31]
@@ -15,25 +24,14 @@ class HeelRaises(ExerciseBase):
             weight_stability=0.35,
             weight_tempo=0.4,
         )
-        self.scorer.config = self.config
-
-    def process(self, landmarks):
-        ankle = landmarks[27]
-        toe = landmarks[31]
 
-        vertical_dist = toe.y - ankle.y
+    def process(self, landmarks, xy):
+        y = xy[:, 1]
+        vertical_dist = y[31] - y[27]
         proxy_angle = vertical_dist * 100
         self.rom_tracker.update(proxy_angle)
         self.rep_completed = False
 
-        if vertical_dist < 0.02:
-            self._on_rep_start()
-            self.stage = "down"
-            self.feedback = "Raise heels slowly"
-        elif vertical_dist > 0.03 and self.stage == "down":  # Lower threshold
-            self.stage = "up"
-            self.counter += 1
-            self._on_rep_complete()
-            self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
-
-        return self.counter, self.stage, self.feedback, {"angle": 0, "points": [ankle, toe]}
+        self._advance(vertical_dist)
+
+        return self.counter, self.stage, self.feedback, self._render_data(0, xy)
@@ -1,9 +1,18 @@
-from .base import ExerciseBase
+import operator
+import sys
+
+from .base import ExerciseBase, STAGE_DOWN, STAGE_UP
 from pipeline.scorer import ExerciseConfig
-from pipeline.feature_engine import calculate_angle_2d
 
 
 class StandingHipExtension(ExerciseBase):
+    _FB_CUE = sys.intern("Kick leg backward")
+
+    _ANGLE_TRIPLET = (11, 23, 27)
+    _TRANSITIONS = ((operator.gt, 170.0, STAGE_DOWN), (operator.lt, 165.0, STAGE_UP))
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [11, 23, 27]
@@ -15,25 +24,4 @@ class StandingHipExtension(ExerciseBase):
             weight_stability=0.4,
             weight_tempo=0.25,
         )
-        self.scorer.config = self.config
-
-    def process(self, landmarks):
-        shoulder = landmarks[11]
-        hip = landmarks[23]
-        ankle = landmarks[27]
-
-        angle = calculate_angle_2d(shoulder, hip, ankle)
-        self.rom_tracker.update(angle)
-        self.rep_completed = False
-
-        if angle > 170:
-            self._on_rep_start()
-            self.stage = "down"
-            self.feedback = "Kick leg backward"
-        if angle < 165 and self.stage == "down":  # Low threshold
-            self.stage = "up"
-            self.counter += 1
-            self._on_rep_complete()
-            self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
 
-        return self.counter, self.stage, self.feedback, {"angle": angle, "points": [shoulder, hip, ankle]}
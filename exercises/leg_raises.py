@@ -1,9 +1,18 @@
-from .base import ExerciseBase
+import operator
+import sys
+
+from .base import ExerciseBase, STAGE_DOWN, STAGE_UP
 from pipeline.scorer import ExerciseConfig
-from pipeline.feature_engine import calculate_angle_2d
 
 
 class LegRaises(ExerciseBase):
+    _FB_CUE = sys.intern("Raise leg")
+
+    _ANGLE_TRIPLET = (11, 23, 25)
+    _TRANSITIONS = ((operator.gt, 160.0, STAGE_DOWN), (operator.lt, 150.0, STAGE_UP))
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [11, 23, 25]
@@ -15,25 +24,4 @@ class LegRaises(ExerciseBase):
             weight_stability=0.3,
             weight_tempo=0.25,
         )
-        self.scorer.config = self.config
-
-    def process(self, landmarks):
-        shoulder = landmarks[11]
-        hip = landmarks[23]
-        knee = landmarks[25]
-
-        angle = calculate_angle_2d(shoulder, hip, knee)
-        self.rom_tracker.update(angle)
-        self.rep_completed = False
-
-        if angle > 160:
-            self._on_rep_start()
-            self.stage = "down"
-            self.feedback = "Raise leg"
-        if angle < 150 and self.stage == "down":  # Low threshold: even small raises count
-            self.stage = "up"
-            self.counter += 1
-            self._on_rep_complete()
-            self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
 
-        return self.counter, self.stage, self.feedback, {"angle": angle, "points": [shoulder, hip, knee]}
@@ -1,8 +1,15 @@
-from .base import ExerciseBase
+import sys
+
+from .base import ExerciseBase, STAGE_LEFT_LIFTED, STAGE_RIGHT_LIFTED
 from pipeline.scorer import ExerciseConfig
 
 
 class Marching(ExerciseBase):
+    _FB_LIFT_RIGHT = sys.intern("Now lift right")
+    _FB_LIFT_LEFT = sys.intern("Now lift left")
+
+    __slots__ = ('last_leg_lifted',)
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [23, 25, 24, 26]
@@ -15,44 +22,45 @@ class Marching(ExerciseBase):
             weight_stability=0.4,
             weight_tempo=0.3,
         )
-        self.scorer.config = self.config
 
     def reset(self):
         super().reset()
         self.last_leg_lifted = None
 
-    def process(self, landmarks):
-        l_hip = landmarks[23]
-        l_knee = landmarks[25]
-        r_hip = landmarks[24]
-        r_knee = landmarks[26]
+    def process(self, landmarks, xy):
+        # Single gather of the Y column; all lift features below are
+        # scalar reads from this contiguous view.
+        y = xy[:, 1]
+        l_hip_y = y[23]
+        l_knee_y = y[25]
+        r_hip_y = y[24]
+        r_knee_y = y[26]
 
-        l_lift = max(0, (l_hip.y + 0.05) - l_knee.y) * 100  # Lower threshold
-        r_lift = max(0, (r_hip.y + 0.05) - r_knee.y) * 100
+        l_lift = max(0, (l_hip_y + 0.05) - l_knee_y) * 100  # Lower threshold
+        r_lift = max(0, (r_hip_y + 0.05) - r_knee_y) * 100
         self.rom_tracker.update(max(l_lift, r_lift))
 
         self.rep_completed = False
 
-        if l_knee.y < (l_hip.y + 0.05):  # Lower threshold for detecting lift
+        if l_knee_y < (l_hip_y + 0.05):  # Lower threshold for detecting lift
             if self.last_leg_lifted != "left":
-                self.stage = "left lifted"
-                self.feedback = "Now lift right"
+                self.stage = STAGE_LEFT_LIFTED
+                self.feedback = self._FB_LIFT_RIGHT
                 if self.last_leg_lifted == "right":
                     self._on_rep_start()
                     self.counter += 1
                     self._on_rep_complete()
-                    self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
+                    self.feedback = self._rep_feedback
                 self.last_leg_lifted = "left"
-        elif r_knee.y < (r_hip.y + 0.05):
+        elif r_knee_y < (r_hip_y + 0.05):
             if self.last_leg_lifted != "right":
-                self.stage = "right lifted"
-                self.feedback = "Now lift left"
+                self.stage = STAGE_RIGHT_LIFTED
+                self.feedback = self._FB_LIFT_LEFT
                 if self.last_leg_lifted == "left":
                     self._on_rep_start()
                     self.counter += 1
                     self._on_rep_complete()
-                    self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
+                    self.feedback = self._rep_feedback
                 self.last_leg_lifted = "right"
 
-        points = [l_hip, l_knee, r_hip, r_knee]
-        return self.counter, self.stage, self.feedback, {"angle": 0, "points": points}
+        return self.counter, self.stage, self.feedback, self._render_data(0, xy)
@@ -1,9 +1,18 @@
-from .base import ExerciseBase
+import operator
+import sys
+
+from .base import ExerciseBase, STAGE_DOWN, STAGE_UP
 from pipeline.scorer import ExerciseConfig
-from pipeline.feature_engine import calculate_angle_2d
 
 
 class SideArmRaises(ExerciseBase):
+    _FB_CUE = sys.intern("Raise arms to side")
+
+    _ANGLE_TRIPLET = (23, 11, 15)
+    _TRANSITIONS = ((operator.lt, 35.0, STAGE_DOWN), (operator.gt, 50.0, STAGE_UP))
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [23, 11, 15]
@@ -15,25 +24,4 @@ class SideArmRaises(ExerciseBase):
             weight_stability=0.25,
             weight_tempo=0.3,
         )
-        self.scorer.config = self.config
-
-    def process(self, landmarks):
-        hip = landmarks[23]
-        shoulder = landmarks[11]
-        wrist = landmarks[15]
-
-        angle = calculate_angle_2d(hip, shoulder, wrist)
-        self.rom_tracker.update(angle)
-        self.rep_completed = False
-
-        if angle < 35:
-            self._on_rep_start()
-            self.stage = "down"
-            self.feedback = "Raise arms to side"
-        if angle > 50 and self.stage == "down":  # Low threshold: even small raises count
-            self.stage = "up"
-            self.counter += 1
-            self._on_rep_complete()
-            self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
 
-        return self.counter, self.stage, self.feedback, {"angle": angle, "points": [hip, shoulder, wrist]}
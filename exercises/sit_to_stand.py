@@ -1,8 +1,17 @@
-from .base import ExerciseBase
+import operator
+import sys
+
+from .base import ExerciseBase, STAGE_SEATED, STAGE_STANDING
 from pipeline.scorer import ExerciseConfig
 
 
 class SitToStand(ExerciseBase):
+    _FB_CUE = sys.intern("Stand up")
+
+    _TRANSITIONS = ((operator.lt, 0.1, STAGE_SEATED), (operator.gt, 0.15, STAGE_STANDING))
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [23, 25]
@@ -14,26 +23,13 @@ class SitToStand(ExerciseBase):
             weight_stability=0.4,
             weight_tempo=0.3,
         )
-        self.scorer.config = self.config
-
-    def process(self, landmarks):
-        hip = landmarks[23]
-        knee = landmarks[25]
 
-        vertical_dist = knee.y - hip.y
+    def process(self, landmarks, xy):
+        vertical_dist = xy[25, 1] - xy[23, 1]
         proxy_angle = vertical_dist * 100
         self.rom_tracker.update(proxy_angle)
         self.rep_completed = False
 
-        if vertical_dist < 0.1:
-            self._on_rep_start()
-            self.stage = "seated"
-            self.feedback = "Stand up"
-        elif vertical_dist > 0.15 and self.stage == "seated":  # Lower threshold
-            self.stage = "standing"
-            self.counter += 1
-            self._on_rep_complete()
-            self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
-
-        points = [hip, knee]
-        return self.counter, self.stage, self.feedback, {"angle": 0, "points": points}
+        self._advance(vertical_dist)
+
+        return self.counter, self.stage, self.feedback, self._render_data(0, xy)
@@ -1,9 +1,18 @@
-from .base import ExerciseBase
+import operator
+import sys
+
+from .base import ExerciseBase, STAGE_DOWN, STAGE_UP
 from pipeline.scorer import ExerciseConfig
-from pipeline.feature_engine import calculate_angle_2d
 
 
 class Squats(ExerciseBase):
+    _FB_CUE = sys.intern("Squat down")
+
+    _ANGLE_TRIPLET = (23, 25, 27)
+    _TRANSITIONS = ((operator.gt, 160.0, STAGE_UP), (operator.lt, 140.0, STAGE_DOWN))
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [23, 25, 27]
@@ -15,25 +24,4 @@ class Squats(ExerciseBase):
             weight_stability=0.35,
             weight_tempo=0.25,
         )
-        self.scorer.config = self.config
-
-    def process(self, landmarks):
-        hip = landmarks[23]
-        knee = landmarks[25]
-        ankle = landmarks[27]
-
-        angle = calculate_angle_2d(hip, knee, ankle)
-        self.rom_tracker.update(angle)
-        self.rep_completed = False
-
-        if angle > 160:
-            self._on_rep_start()
-            self.stage = "up"
-            self.feedback = "Squat down"
-        if angle < 140 and self.stage == "up":  # Low threshold so partial reps count
-            self.stage = "down"
-            self.counter += 1
-            self._on_rep_complete()
-            self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
 
-        return self.counter, self.stage, self.feedback, {"angle": angle, "points": [hip, knee, ankle]}
@@ -1,9 +1,18 @@
-from .base import ExerciseBase
+import operator
+import sys
+
+from .base import ExerciseBase, STAGE_DOWN, STAGE_UP
 from pipeline.scorer import ExerciseConfig
-from pipeline.feature_engine import calculate_angle_2d
 
 
 class WallPushups(ExerciseBase):
+    _FB_CUE = sys.intern("Lean into wall")
+
+    _ANGLE_TRIPLET = (11, 13, 15)
+    _TRANSITIONS = ((operator.gt, 150.0, STAGE_UP), (operator.lt, 130.0, STAGE_DOWN))
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.relevant_landmarks = [11, 13, 15]
@@ -15,25 +24,4 @@ class WallPushups(ExerciseBase):
             weight_stability=0.25,
             weight_tempo=0.3,
         )
-        self.scorer.config = self.config
-
-    def process(self, landmarks):
-        shoulder = landmarks[11]
-        elbow = landmarks[13]
-        wrist = landmarks[15]
-
-        angle = calculate_angle_2d(shoulder, elbow, wrist)
-        self.rom_tracker.update(angle)
-        self.rep_completed = False
-
-        if angle > 150:
-            self._on_rep_start()
-            self.stage = "up"
-            self.feedback = "Lean into wall"
-        if angle < 130 and self.stage == "up":  # Low threshold so partial pushups count
-            self.stage = "down"
-            self.counter += 1
-            self._on_rep_complete()
-            self.feedback = f"Rep done! Score: {self.last_rep_scores['final_score']}"
 
-        return self.counter, self.stage, self.feedback, {"angle": angle, "points": [shoulder, elbow, wrist]}
@@ -3,17 +3,30 @@ Pipeline Package
 Exports all pipeline modules for easy import.
 """
 
-from .landmark_processor import process_landmarks, ProcessedLandmark
+from .landmark_processor import (
+    process_landmarks,
+    process_landmarks_array,
+    landmarks_to_array,
+    filter_visibility_array,
+    process_landmarks_frame,
+    ProcessedLandmark,
+    LandmarkFrame,
+    LandmarkBuffer,
+)
 from .smoother import EMALandmarkSmoother
 from .feature_engine import (
     calculate_angle_3d,
     calculate_angle_2d,
+    calculate_angle_xy,
+    calculate_angles_2d_batch,
+    calculate_angles_2d_stacked,
+    calculate_angle_series,
     ROMTracker,
     VelocityTracker,
     SwayTracker,
     TempoTracker,
 )
-from .scorer import ExerciseConfig, RepScorer, compute_final_score
+from .scorer import ExerciseConfig, RepScorer, score_rep, compute_final_score
 from .feedback import FeedbackEngine, FeedbackRule, create_default_feedback_engine
 from .session import Session, RepRecord
 from .progression import ProgressionState
@@ -0,0 +1,30 @@
+"""
+Optional-JIT Support
+Single home for the Numba import guard. Modules decorate hot scalar
+math with @maybe_njit() and transparently fall back to pure Python
+when Numba is not installed, so it stays an optional dependency.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range  # parallel loops degrade to plain loops without Numba
+
+    def njit(*args, **kwargs):
+        """No-op decorator stand-in used when Numba is not installed."""
+        def decorate(fn):
+            return fn
+        if args and callable(args[0]):
+            return args[0]
+        return decorate
+
+
+def maybe_njit(**kwargs):
+    """njit(cache=True, fastmath=True) when Numba is present, no-op otherwise.
+
+    cache=True persists compiled artifacts across runs so the compile
+    cost is paid once per machine, not once per session.
+    """
+    return njit(cache=True, fastmath=True, **kwargs)
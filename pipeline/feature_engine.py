@@ -7,50 +7,119 @@ Converts smoothed/normalized landmarks into biomechanical metrics:
 - Hip sway (stability metric)
 """
 
+import math
 import numpy as np
-from collections import deque
 import time
 
+from .kernels import angle_2d
+
+_RAD2DEG = 180.0 / math.pi
+
 
 def calculate_angle_3d(a, b, c):
     """
     Calculate angle at vertex B formed by points A-B-C using the cosine rule.
     Works with any object that has .x, .y, .z attributes.
-    
+
+    Fully scalar: like the 2D path, three-element inputs sit far below
+    the size where NumPy dispatch pays for itself, so the dot product
+    and magnitudes are inlined with plain math.
+
     Returns angle in degrees (0-180).
     """
-    ba = np.array([a.x - b.x, a.y - b.y, a.z - b.z])
-    bc = np.array([c.x - b.x, c.y - b.y, c.z - b.z])
+    bax = a.x - b.x
+    bay = a.y - b.y
+    baz = a.z - b.z
+    bcx = c.x - b.x
+    bcy = c.y - b.y
+    bcz = c.z - b.z
 
-    mag_ba = np.linalg.norm(ba)
-    mag_bc = np.linalg.norm(bc)
+    mag_ba = math.sqrt(bax * bax + bay * bay + baz * baz)
+    mag_bc = math.sqrt(bcx * bcx + bcy * bcy + bcz * bcz)
 
     if mag_ba < 1e-6 or mag_bc < 1e-6:
         return 0.0
 
-    cosine = np.dot(ba, bc) / (mag_ba * mag_bc)
-    cosine = np.clip(cosine, -1.0, 1.0)
-    angle = np.degrees(np.arccos(cosine))
-    return float(angle)
+    cosine = (bax * bcx + bay * bcy + baz * bcz) / (mag_ba * mag_bc)
+    if cosine > 1.0:
+        cosine = 1.0
+    elif cosine < -1.0:
+        cosine = -1.0
+    return math.acos(cosine) * _RAD2DEG
 
 
 def calculate_angle_2d(a, b, c):
     """
     Calculate angle at vertex B formed by points A-B-C using atan2 (2D, x/y only).
     Backward compatible with original exercise logic.
+
+    Pure scalar math: NumPy's per-call dispatch on 2-element arrays costs
+    far more than the arithmetic itself at this size. The arithmetic lives
+    in the jitted kernels.angle_2d; this wrapper only unpacks attributes.
+    """
+    return angle_2d(a.x, a.y, b.x, b.y, c.x, c.y)
+
+
+def calculate_angle_xy(xy, i, j, k):
+    """
+    Angle at vertex j formed by landmark rows i-j-k of an (N, 2+) array.
+    Array-indexed twin of calculate_angle_2d for SoA landmark buffers.
+    """
+    return angle_2d(xy[i, 0], xy[i, 1], xy[j, 0], xy[j, 1], xy[k, 0], xy[k, 1])
+
+
+def calculate_angles_2d_stacked(A, B, C):
+    """
+    Angles at the vertices B for stacked point arrays.
+
+    Args:
+        A, B, C: (K, 2) arrays of x/y coordinates; row k describes one
+            A-B-C triangle.
+
+    Returns:
+        (K,) float array of angles in degrees (0-180), from a single
+        np.arctan2 pair regardless of K.
+    """
+    d = np.abs(
+        (np.arctan2(C[:, 1] - B[:, 1], C[:, 0] - B[:, 0])
+         - np.arctan2(A[:, 1] - B[:, 1], A[:, 0] - B[:, 0])) * _RAD2DEG
+    )
+    return 180.0 - np.abs(d % 360.0 - 180.0)
+
+
+def calculate_angles_2d_batch(xy, triplets):
+    """
+    Vectorized variant of calculate_angle_2d for several joints at once.
+
+    Computes the angle at vertex B for every (A, B, C) landmark-index row
+    in `triplets` with a single np.arctan2 call, instead of one scalar
+    call per joint. Useful whenever more than one angle is needed from
+    the same frame (e.g. multi-exercise dashboards, asymmetry checks).
+
+    Args:
+        xy: (N, 2) array of landmark x/y coordinates.
+        triplets: (K, 3) integer array of (a, b, c) landmark indices.
+
+    Returns:
+        (K,) float array of angles in degrees (0-180).
     """
-    a_arr = np.array([a.x, a.y])
-    b_arr = np.array([b.x, b.y])
-    c_arr = np.array([c.x, c.y])
+    xy = np.asarray(xy)
+    triplets = np.asarray(triplets)
+    return calculate_angles_2d_stacked(
+        xy[triplets[:, 0]], xy[triplets[:, 1]], xy[triplets[:, 2]]
+    )
 
-    radians = np.arctan2(c_arr[1] - b_arr[1], c_arr[0] - b_arr[0]) - \
-              np.arctan2(a_arr[1] - b_arr[1], a_arr[0] - b_arr[0])
-    angle = np.abs(radians * 180.0 / np.pi)
 
-    if angle > 180.0:
-        angle = 360.0 - angle
+def calculate_angle_series(xy_seq, i, j, k):
+    """
+    Angle at vertex j over a whole (T, N, 2) landmark tensor.
 
-    return float(angle)
+    One np.arctan2 call covers the full window, so offline scoring of a
+    recorded video pays vectorized cost instead of one trig call per
+    frame. Returns a (T,) float array of degrees (0-180).
+    """
+    xy_seq = np.asarray(xy_seq)
+    return calculate_angles_2d_stacked(xy_seq[:, i], xy_seq[:, j], xy_seq[:, k])
 
 
 class ROMTracker:
@@ -111,10 +180,15 @@ class VelocityTracker:
     def update(self, landmark, current_time: float = None):
         """
         Update with a new landmark position.
+
+        Pass `current_time` when the caller already read the clock this
+        frame (one time.monotonic() read can feed every tracker); it
+        defaults to a fresh monotonic read otherwise.
+
         Returns the current velocity magnitude.
         """
         if current_time is None:
-            current_time = time.time()
+            current_time = time.monotonic()
 
         position = np.array([landmark.x, landmark.y, landmark.z])
 
@@ -138,15 +212,28 @@ class SwayTracker:
     """
     Measures horizontal hip sway (stability) over a sliding window.
     Higher sway = lower stability.
+
+    O(1) per frame: a ring buffer remembers the sample falling out of
+    the window, and running sum / sum-of-squares give the std without
+    re-scanning all W samples each update. hip_x values are well inside
+    [0, 1], so the catastrophic-cancellation risk of the sum-of-squares
+    form is negligible at window sizes like 30.
     """
 
     def __init__(self, window_size: int = 30):
         self.window_size = window_size
-        self.hip_x_history = deque(maxlen=window_size)
+        self.buf = np.zeros(window_size, dtype=np.float64)
+        self.idx = 0
+        self.count = 0
+        self.s1 = 0.0  # running sum over the window
+        self.s2 = 0.0  # running sum of squares over the window
         self.current_sway = 0.0
 
     def reset(self):
-        self.hip_x_history.clear()
+        self.idx = 0
+        self.count = 0
+        self.s1 = 0.0
+        self.s2 = 0.0
         self.current_sway = 0.0
 
     def update(self, hip_center_x: float) -> float:
@@ -154,10 +241,24 @@ class SwayTracker:
         Update with current hip center X position.
         Returns the current sway (standard deviation of recent hip_x values).
         """
-        self.hip_x_history.append(hip_center_x)
-
-        if len(self.hip_x_history) >= 5:
-            self.current_sway = float(np.std(list(self.hip_x_history)))
+        x = float(hip_center_x)
+        if self.count == self.window_size:
+            # Evict the outgoing sample's contribution
+            old = float(self.buf[self.idx])
+            self.s1 -= old
+            self.s2 -= old * old
+        else:
+            self.count += 1
+        self.buf[self.idx] = x
+        self.idx = (self.idx + 1) % self.window_size
+        self.s1 += x
+        self.s2 += x * x
+
+        if self.count >= 5:
+            n = self.count
+            mean = self.s1 / n
+            variance = self.s2 / n - mean * mean
+            self.current_sway = math.sqrt(variance) if variance > 0.0 else 0.0
         else:
             self.current_sway = 0.0
 
@@ -177,17 +278,24 @@ class TempoTracker:
         self.rep_start_time = None
         self.rep_times = []
 
-    def start_rep(self):
-        """Call when a new rep movement begins."""
-        self.rep_start_time = time.time()
+    def start_rep(self, now: float = None):
+        """Call when a new rep movement begins.
 
-    def complete_rep(self) -> float:
+        `now` lets the caller share one time.monotonic() read across
+        trackers; it defaults to a fresh read. Monotonic time is immune
+        to wall-clock adjustments, so rep durations can't go negative.
+        """
+        self.rep_start_time = time.monotonic() if now is None else now
+
+    def complete_rep(self, now: float = None) -> float:
         """Call when a rep completes. Returns the time for this rep in seconds."""
         if self.rep_start_time is None:
             return 0.0
-        rep_time = time.time() - self.rep_start_time
+        if now is None:
+            now = time.monotonic()
+        rep_time = now - self.rep_start_time
         self.rep_times.append(rep_time)
-        self.rep_start_time = time.time()  # Next rep starts immediately
+        self.rep_start_time = now  # Next rep starts immediately
         return rep_time
 
     @property
@@ -4,22 +4,42 @@ Rule-based per-frame and per-rep feedback generation.
 Evaluates biomechanical conditions and returns prioritized corrections.
 """
 
+import math
+from bisect import insort
+
+import numpy as np
+
+_RAD2DEG = 180.0 / math.pi
+
 
 class FeedbackRule:
     """A single feedback rule."""
 
-    def __init__(self, name: str, condition_fn, message: str, priority: int = 5):
+    def __init__(self, name: str, condition_fn, message: str, priority: int = 5,
+                 batch_fn=None, required_context=frozenset(),
+                 required_landmarks=()):
         """
         Args:
             name: Rule identifier.
             condition_fn: Callable(landmarks, context) -> bool.
             message: Feedback string to display when triggered.
             priority: Lower number = higher priority.
+            batch_fn: Optional callable(xyz_batch, context) -> bool array of
+                shape (B,), evaluating the condition over a whole
+                (B, 33, 2+) landmark window at once. Rules without one are
+                skipped by evaluate_batch.
+            required_context: Context keys the condition reads; the rule is
+                skipped (not errored) when any is missing.
+            required_landmarks: Landmark indices the condition reads; the
+                rule is skipped when the frame has fewer landmarks.
         """
         self.name = name
         self.condition_fn = condition_fn
         self.message = message
         self.priority = priority
+        self.batch_fn = batch_fn
+        self.required_context = frozenset(required_context)
+        self.max_landmark = max(required_landmarks, default=-1)
 
 
 class FeedbackEngine:
@@ -31,8 +51,17 @@ class FeedbackEngine:
         self.rules: list[FeedbackRule] = []
 
     def add_rule(self, rule: FeedbackRule):
-        self.rules.append(rule)
-        self.rules.sort(key=lambda r: r.priority)
+        """Insert a rule at its priority position (no full re-sort)."""
+        insort(self.rules, rule, key=lambda r: r.priority)
+
+    def freeze(self):
+        """Convert the rule list to a tuple once setup is done.
+
+        Rules are added at startup and then only iterated; a tuple
+        iterates slightly faster in the per-frame loop and makes the
+        frozen state explicit. add_rule after freeze() raises.
+        """
+        self.rules = tuple(self.rules)
 
     def evaluate(self, landmarks, context: dict) -> list[str]:
         """
@@ -45,13 +74,57 @@ class FeedbackEngine:
         Returns:
             List of triggered feedback messages, ordered by priority.
         """
+        # Rules declare what they read up front, so unmet requirements
+        # skip the rule instead of raising inside it — no per-rule
+        # try/except, and genuine bugs in a condition surface instead
+        # of being swallowed.
+        n_landmarks = len(landmarks) if landmarks is not None else 0
+        ctx_keys = context.keys()
         triggered = []
         for rule in self.rules:
-            try:
-                if rule.condition_fn(landmarks, context):
-                    triggered.append(rule.message)
-            except Exception:
-                pass
+            if rule.max_landmark >= n_landmarks or not rule.required_context <= ctx_keys:
+                continue
+            if rule.condition_fn(landmarks, context):
+                triggered.append(rule.message)
+        return triggered
+
+    def evaluate_batch(self, xyz_batch, context: dict) -> list[list[str]]:
+        """
+        Evaluate all rules over a whole window of frames at once.
+
+        Each rule with a batch_fn runs as one vectorized condition over
+        the (B, 33, 2+) landmark tensor instead of B Python calls, so
+        the per-rule interpreter overhead is paid once per window. A
+        context-only rule may return a scalar bool, which applies to
+        every frame. There is no per-rule try/except here: the input
+        shape is validated once up front and batch conditions are pure
+        array ops.
+
+        Args:
+            xyz_batch: (B, 33, 2+) array of landmark coordinates.
+            context: Dict shared by the window (ROM, tempo, asymmetry...).
+
+        Returns:
+            Per-frame lists of triggered messages, ordered by priority.
+        """
+        xyz_batch = np.asarray(xyz_batch)
+        if xyz_batch.ndim != 3:
+            raise ValueError(
+                f"expected (B, N, 2+) landmark batch, got shape {xyz_batch.shape}"
+            )
+        n_frames = xyz_batch.shape[0]
+        triggered = [[] for _ in range(n_frames)]
+        for rule in self.rules:
+            if rule.batch_fn is None:
+                continue
+            mask = rule.batch_fn(xyz_batch, context)
+            if mask is True or mask is False:
+                if mask:
+                    for msgs in triggered:
+                        msgs.append(rule.message)
+            else:
+                for b in np.nonzero(mask)[0]:
+                    triggered[b].append(rule.message)
         return triggered
 
 
@@ -66,14 +139,14 @@ def _knee_valgus_check(landmarks, context):
 
 def _excessive_forward_lean(landmarks, context):
     """Check if torso is leaning too far forward."""
-    import numpy as np
     shoulder = landmarks[11]
     hip = landmarks[23]
-    
-    # Compute torso angle from vertical
+
+    # Compute torso angle from vertical. Scalar math: NumPy's ufunc
+    # dispatch on 0-D inputs costs more than the trig itself.
     dx = shoulder.x - hip.x
     dy = shoulder.y - hip.y
-    angle_from_vertical = abs(np.degrees(np.arctan2(dx, -dy)))
+    angle_from_vertical = abs(math.atan2(dx, -dy) * _RAD2DEG)
     return angle_from_vertical > 25.0
 
 
@@ -97,13 +170,47 @@ def _too_fast(landmarks, context):
     return rep_time > 0 and rep_time < ideal * 0.5
 
 
+# ---- Batched variants: one boolean vector per (B, 33, 2+) window ----
+
+def _knee_valgus_batch(xyz, context):
+    """Vectorized _knee_valgus_check over a frame window."""
+    return xyz[:, 25, 0] < xyz[:, 27, 0] - 0.02
+
+
+def _excessive_forward_lean_batch(xyz, context):
+    """Vectorized _excessive_forward_lean: one arctan2 over the window."""
+    dx = xyz[:, 11, 0] - xyz[:, 23, 0]
+    dy = xyz[:, 11, 1] - xyz[:, 23, 1]
+    return np.abs(np.arctan2(dx, -dy)) * _RAD2DEG > 25.0
+
+
+def _left_right_asymmetry_batch(xyz, context):
+    """Context-only: one scalar result applies to the whole window."""
+    return _left_right_asymmetry(None, context)
+
+
+def _poor_depth_batch(xyz, context):
+    return _poor_depth(None, context)
+
+
+def _too_fast_batch(xyz, context):
+    return _too_fast(None, context)
+
+
 # Pre-built common rules
 COMMON_RULES = [
-    FeedbackRule("knee_valgus", _knee_valgus_check, "Keep knees aligned with toes", priority=1),
-    FeedbackRule("forward_lean", _excessive_forward_lean, "Keep chest upright", priority=2),
-    FeedbackRule("asymmetry", _left_right_asymmetry, "Distribute weight evenly", priority=3),
-    FeedbackRule("poor_depth", _poor_depth, "Try to go deeper for full range", priority=4),
-    FeedbackRule("too_fast", _too_fast, "Slow down for controlled tempo", priority=5),
+    FeedbackRule("knee_valgus", _knee_valgus_check, "Keep knees aligned with toes",
+                 priority=1, batch_fn=_knee_valgus_batch,
+                 required_landmarks=(25, 27)),
+    FeedbackRule("forward_lean", _excessive_forward_lean, "Keep chest upright",
+                 priority=2, batch_fn=_excessive_forward_lean_batch,
+                 required_landmarks=(11, 23)),
+    FeedbackRule("asymmetry", _left_right_asymmetry, "Distribute weight evenly",
+                 priority=3, batch_fn=_left_right_asymmetry_batch),
+    FeedbackRule("poor_depth", _poor_depth, "Try to go deeper for full range",
+                 priority=4, batch_fn=_poor_depth_batch),
+    FeedbackRule("too_fast", _too_fast, "Slow down for controlled tempo",
+                 priority=5, batch_fn=_too_fast_batch),
 ]
 
 
@@ -112,4 +219,5 @@ def create_default_feedback_engine() -> FeedbackEngine:
     engine = FeedbackEngine()
     for rule in COMMON_RULES:
         engine.add_rule(rule)
+    engine.freeze()
     return engine
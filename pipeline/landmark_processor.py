@@ -5,17 +5,28 @@ Landmark Processor Module
 - Torso-length scale normalization (device independence)
 """
 
+import math
+
 import numpy as np
+from collections import namedtuple
 from dataclasses import dataclass, field
 from typing import Optional
 
+from .kernels import NUMBA_AVAILABLE, normalize_frame
+
 
 VISIBILITY_THRESHOLD = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedLandmark:
-    """A single processed landmark with normalized coordinates."""
+    """A single processed landmark with normalized coordinates.
+
+    Kept for interop with code that hands landmarks around as objects
+    (the smoother writes back onto .x/.y/.z, and the capture loop
+    synthesizes these for extrapolated frames). Array-first consumers
+    should use LandmarkFrame instead.
+    """
     x: float
     y: float
     z: float
@@ -23,9 +34,47 @@ class ProcessedLandmark:
     valid: bool = True
 
 
-def _lm_to_array(lm):
-    """Convert a mediapipe landmark to numpy array [x, y, z]."""
-    return np.array([lm.x, lm.y, lm.z])
+# Struct-of-arrays landmark frame: one contiguous (33, 3) coordinate
+# matrix plus parallel visibility/valid vectors, instead of 33 Python
+# objects with five attributes each. Geometry consumers index rows
+# (frame.xyz[25, 0]) or slice columns without any attribute chasing.
+LandmarkFrame = namedtuple('LandmarkFrame', ['xyz', 'visibility', 'valid'])
+
+
+def landmarks_to_array(landmarks):
+    """
+    Flatten landmark .x/.y/.z attributes into a (N, 3) float32 array.
+
+    One traversal of the landmark list replaces the per-consumer
+    attribute access pattern: downstream code indexes rows of the array
+    instead of re-reading the same landmark objects.
+    """
+    n = len(landmarks)
+    return np.fromiter(
+        (v for lm in landmarks for v in (lm.x, lm.y, lm.z)),
+        dtype=np.float32, count=3 * n,
+    ).reshape(n, 3)
+
+
+def filter_visibility_array(landmarks, threshold=VISIBILITY_THRESHOLD):
+    """
+    Array-native visibility filter.
+
+    One np.fromiter pass gathers x/y/z/visibility for all landmarks into
+    a (N, 4) float32 matrix, and the validity test is a single vectorized
+    compare — versus one getattr chain and one ProcessedLandmark
+    allocation per landmark in filter_visibility.
+
+    Returns (arr, valid) where arr is (N, 4) with columns x, y, z,
+    visibility and valid is a (N,) boolean mask.
+    """
+    n = len(landmarks)
+    arr = np.fromiter(
+        (v for lm in landmarks
+         for v in (lm.x, lm.y, lm.z, getattr(lm, 'visibility', 1.0))),
+        dtype=np.float32, count=4 * n,
+    ).reshape(n, 4)
+    return arr, arr[:, 3] >= threshold
 
 
 def filter_visibility(landmarks, threshold=VISIBILITY_THRESHOLD):
@@ -45,17 +94,19 @@ def filter_visibility(landmarks, threshold=VISIBILITY_THRESHOLD):
 
 
 def compute_hip_center(landmarks):
-    """Compute the midpoint between left hip (23) and right hip (24)."""
-    left_hip = _lm_to_array(landmarks[23])
-    right_hip = _lm_to_array(landmarks[24])
-    return (left_hip + right_hip) / 2.0
+    """Midpoint between left hip (23) and right hip (24) as an (x, y, z) tuple.
+
+    Scalar math on purpose: building two 3-element ndarrays per call
+    costs ~20x the arithmetic at this size.
+    """
+    a, b = landmarks[23], landmarks[24]
+    return ((a.x + b.x) * 0.5, (a.y + b.y) * 0.5, (a.z + b.z) * 0.5)
 
 
 def compute_mid_shoulder(landmarks):
-    """Compute the midpoint between left shoulder (11) and right shoulder (12)."""
-    left_shoulder = _lm_to_array(landmarks[11])
-    right_shoulder = _lm_to_array(landmarks[12])
-    return (left_shoulder + right_shoulder) / 2.0
+    """Midpoint between left shoulder (11) and right shoulder (12) as a tuple."""
+    a, b = landmarks[11], landmarks[12]
+    return ((a.x + b.x) * 0.5, (a.y + b.y) * 0.5, (a.z + b.z) * 0.5)
 
 
 def normalize_landmarks(processed_landmarks, hip_center, torso_length):
@@ -66,13 +117,16 @@ def normalize_landmarks(processed_landmarks, hip_center, torso_length):
     if torso_length < 0.01:
         torso_length = 0.01  # prevent division by zero
 
+    # One reciprocal instead of 99 FP divides across the frame
+    inv = 1.0 / torso_length
+    hx, hy, hz = hip_center[0], hip_center[1], hip_center[2]
     normalized = []
     for lm in processed_landmarks:
         if lm.valid:
             normalized.append(ProcessedLandmark(
-                x=(lm.x - hip_center[0]) / torso_length,
-                y=(lm.y - hip_center[1]) / torso_length,
-                z=(lm.z - hip_center[2]) / torso_length,
+                x=(lm.x - hx) * inv,
+                y=(lm.y - hy) * inv,
+                z=(lm.z - hz) * inv,
                 visibility=lm.visibility,
                 valid=True
             ))
@@ -99,9 +153,112 @@ def process_landmarks(raw_landmarks):
     # Step 2: Compute reference points (use raw landmarks for reference calc)
     hip_center = compute_hip_center(raw_landmarks)
     mid_shoulder = compute_mid_shoulder(raw_landmarks)
-    torso_length = float(np.linalg.norm(mid_shoulder - hip_center))
+    torso_length = math.sqrt(
+        (mid_shoulder[0] - hip_center[0]) ** 2
+        + (mid_shoulder[1] - hip_center[1]) ** 2
+        + (mid_shoulder[2] - hip_center[2]) ** 2
+    )
 
     # Step 3: Normalize
     normalized = normalize_landmarks(processed, hip_center, torso_length)
 
     return normalized, hip_center, torso_length
+
+
+class LandmarkBuffer:
+    """
+    Frame-scoped scratch buffers for process_landmarks_array.
+
+    A pipeline that processes every frame can own one of these and pass
+    it in: the (33, 4) ingest matrix, (33, 3) normalized output and
+    (33,) valid mask are then recycled across calls instead of being
+    reallocated ~30 times a second.
+    """
+
+    __slots__ = ('raw', 'norm', 'valid')
+
+    def __init__(self, num_landmarks: int = 33):
+        self.raw = np.empty((num_landmarks, 4), dtype=np.float32)
+        self.norm = np.empty((num_landmarks, 3), dtype=np.float32)
+        self.valid = np.empty(num_landmarks, dtype=np.bool_)
+
+
+def process_landmarks_array(raw_landmarks, buf: Optional[LandmarkBuffer] = None):
+    """
+    Array-native variant of process_landmarks.
+
+    Builds the (33, 3) coordinate matrix once and does the visibility
+    filter and hip-center/torso normalization as vectorized operations,
+    instead of constructing 66 ProcessedLandmark objects per frame.
+    Passing a LandmarkBuffer makes the call allocation-free: all outputs
+    are views into the buffer, valid until the next call with it.
+
+    Returns (normalized, visibility, hip_center, torso_length) where
+    normalized is (33, 3) float32 and visibility is (33,) float32;
+    rows below the visibility threshold keep their raw coordinates,
+    matching process_landmarks.
+    """
+    if buf is None:
+        lmv, valid = filter_visibility_array(raw_landmarks)
+        norm_out = None
+    else:
+        # In-place ingest, same pattern as the smoother's input buffer:
+        # scalar attribute reads into the recycled matrix.
+        lmv = buf.raw
+        for i, lm in enumerate(raw_landmarks):
+            lmv[i, 0] = lm.x
+            lmv[i, 1] = lm.y
+            lmv[i, 2] = lm.z
+            lmv[i, 3] = getattr(lm, 'visibility', 1.0)
+        valid = np.greater_equal(lmv[:, 3], VISIBILITY_THRESHOLD, out=buf.valid)
+        norm_out = buf.norm
+    arr = lmv[:, :3]
+    visibility = lmv[:, 3]
+
+    if NUMBA_AVAILABLE:
+        # Fused kernel: reference points, torso length and the
+        # visibility-gated normalization in one compiled pass, with no
+        # intermediate arrays.
+        normalized = np.empty_like(arr) if norm_out is None else norm_out
+        hx, hy, hz, torso_length = normalize_frame(
+            lmv, normalized, VISIBILITY_THRESHOLD
+        )
+        hip_center = np.array([hx, hy, hz], dtype=np.float32)
+    else:
+        # Plain-NumPy fallback: the scalar loop inside normalize_frame is
+        # only a win once compiled, so keep the vectorized formulation.
+        hip_center = (arr[23] + arr[24]) / 2.0
+        mid_shoulder = (arr[11] + arr[12]) / 2.0
+        torso_length = float(np.linalg.norm(mid_shoulder - hip_center))
+        if torso_length < 0.01:
+            torso_length = 0.01  # prevent division by zero
+        if norm_out is None:
+            normalized = np.where(
+                valid[:, None], (arr - hip_center) / torso_length, arr
+            )
+        else:
+            np.subtract(arr, hip_center, out=norm_out)
+            norm_out *= 1.0 / torso_length
+            np.copyto(norm_out, arr, where=~valid[:, None])
+            normalized = norm_out
+
+    return normalized, visibility, hip_center, torso_length
+
+
+def process_landmarks_frame(raw_landmarks):
+    """
+    Like process_landmarks_array, but packages the result as a
+    LandmarkFrame so downstream code carries one named value instead of
+    parallel arrays.
+
+    Returns (frame, hip_center, torso_length).
+    """
+    normalized, visibility, hip_center, torso_length = process_landmarks_array(
+        raw_landmarks
+    )
+    frame = LandmarkFrame(
+        xyz=normalized,
+        visibility=visibility,
+        valid=visibility >= VISIBILITY_THRESHOLD,
+    )
+    return frame, hip_center, torso_length
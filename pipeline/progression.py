@@ -5,32 +5,73 @@ Adjusts exercise difficulty after each session based on performance trends.
 
 import json
 import os
+from collections import deque
 from typing import Optional
 
+# orjson serializes/parses in C at several times stdlib speed; like numba
+# in the kernels module it stays optional, with stdlib json as fallback.
+try:
+    import orjson
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+    _loads = json.loads
+
 
 class ProgressionState:
-    """Persistent state for tracking progression across sessions."""
+    """Persistent state for tracking progression across sessions.
+
+    The in-memory score history is bounded to HISTORY_LIMIT sessions so
+    memory and save/load time stay flat over months of rehab; scores
+    falling off the window are appended to a sidecar .archive.jsonl on
+    the next save, and the all-time mean is kept as a running aggregate.
+    """
+
+    # Recent sessions kept in memory/save file; progression decisions
+    # only ever look at the last 3, so 50 leaves ample trend context.
+    HISTORY_LIMIT = 50
 
     def __init__(self):
-        self.session_scores = []  # list of avg_final_score per session
+        # Recent avg_final_score per session (bounded; overflow archived)
+        self.session_scores = deque(maxlen=self.HISTORY_LIMIT)
         self.target_reps = 10
         self.target_rom_multiplier = 1.0  # applied to exercise config target_rom
         self.sway_tolerance_multiplier = 1.0  # applied to exercise config acceptable_sway
+        self._consec_good = 0  # incrementally maintained; avoids O(N) rescans
+        self._total_score = 0.0  # running all-time aggregates
+        self._total_sessions = 0
+        self._pending_archive = []  # evicted scores awaiting the next save()
 
     def record_session(self, avg_score: float):
         """Record a session's average score."""
+        if len(self.session_scores) == self.session_scores.maxlen:
+            self._pending_archive.append(self.session_scores[0])
         self.session_scores.append(avg_score)
+        self._consec_good = self._consec_good + 1 if avg_score > 85 else 0
+        self._total_score += avg_score
+        self._total_sessions += 1
+
+    @property
+    def all_time_average(self) -> float:
+        """Mean score over every recorded session, archived ones included."""
+        if self._total_sessions == 0:
+            return 0.0
+        return self._total_score / self._total_sessions
 
     @property
     def consecutive_good_sessions(self) -> int:
-        """Count of recent consecutive sessions scoring > 85."""
-        count = 0
-        for score in reversed(self.session_scores):
-            if score > 85:
-                count += 1
-            else:
-                break
-        return count
+        """Count of recent consecutive sessions scoring > 85.
+
+        Maintained incrementally by record_session, so reading it is O(1)
+        no matter how long the score history grows.
+        """
+        return self._consec_good
 
     def compute_progression(self) -> dict:
         """
@@ -75,22 +116,48 @@ class ProgressionState:
 
     def save(self, filepath: str):
         """Persist progression state to disk."""
+        if self._pending_archive:
+            # Append-only sidecar preserves full history past the window
+            with open(filepath + ".archive.jsonl", "a") as f:
+                for score in self._pending_archive:
+                    f.write(f"{score}\n")
+            self._pending_archive = []
         data = {
-            "session_scores": self.session_scores,
+            "session_scores": list(self.session_scores),
             "target_reps": self.target_reps,
             "target_rom_multiplier": self.target_rom_multiplier,
             "sway_tolerance_multiplier": self.sway_tolerance_multiplier,
+            "consec_good": self._consec_good,
+            "total_score": self._total_score,
+            "total_sessions": self._total_sessions,
         }
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(_dumps(data))
 
     def load(self, filepath: str):
         """Load progression state from disk."""
         if not os.path.exists(filepath):
             return
-        with open(filepath, "r") as f:
-            data = json.load(f)
-        self.session_scores = data.get("session_scores", [])
+        with open(filepath, "rb") as f:
+            data = _loads(f.read())
+        self.session_scores = deque(
+            data.get("session_scores", []), maxlen=self.HISTORY_LIMIT
+        )
         self.target_reps = data.get("target_reps", 10)
         self.target_rom_multiplier = data.get("target_rom_multiplier", 1.0)
         self.sway_tolerance_multiplier = data.get("sway_tolerance_multiplier", 1.0)
+        self._consec_good = data.get("consec_good", self._recount_consec_good())
+        # Older save files predate the running aggregates; rebuild from
+        # the retained window (archived scores are not re-read).
+        self._total_score = data.get("total_score", float(sum(self.session_scores)))
+        self._total_sessions = data.get("total_sessions", len(self.session_scores))
+
+    def _recount_consec_good(self) -> int:
+        """Rebuild the cached streak from scores (older save files)."""
+        count = 0
+        for score in reversed(self.session_scores):
+            if score > 85:
+                count += 1
+            else:
+                break
+        return count
@@ -19,6 +19,10 @@ Example:
     )
 """
 
+import functools
+
+from ._jit import maybe_njit
+
 
 class ExerciseConfig:
     """
@@ -82,6 +86,12 @@ class ExerciseConfig:
         For strength exercises, use lower (0.2–0.25).
     """
 
+    __slots__ = (
+        'target_rom', 'ideal_rep_time', 'acceptable_sway', 'stability_factor',
+        'tempo_penalty_factor', 'asymmetry_penalty_factor',
+        'weight_rom', 'weight_stability', 'weight_tempo',
+    )
+
     def __init__(
         self,
         target_rom: float = 90.0,
@@ -105,11 +115,13 @@ class ExerciseConfig:
         self.weight_tempo = weight_tempo
 
 
+@maybe_njit()
 def _clamp(value, lo=0.0, hi=100.0):
     """Clamp a value between lo and hi."""
     return max(lo, min(hi, value))
 
 
+@maybe_njit()
 def compute_rom_score(user_rom: float, target_rom: float) -> float:
     """
     Compute ROM (Range of Motion) score.
@@ -134,6 +146,7 @@ def compute_rom_score(user_rom: float, target_rom: float) -> float:
     return _clamp((user_rom / target_rom) * 100.0)
 
 
+@maybe_njit()
 def compute_stability_score(sway: float, acceptable_sway: float, stability_factor: float) -> float:
     """
     Compute stability score based on horizontal hip sway.
@@ -162,6 +175,7 @@ def compute_stability_score(sway: float, acceptable_sway: float, stability_facto
     return _clamp(100.0 - (normalized * stability_factor))
 
 
+@maybe_njit()
 def compute_tempo_score(rep_time: float, ideal_rep_time: float, penalty_factor: float) -> float:
     """
     Compute tempo score with ASYMMETRIC penalties.
@@ -201,6 +215,7 @@ def compute_tempo_score(rep_time: float, ideal_rep_time: float, penalty_factor:
         return _clamp(100.0 - abs(diff) * penalty_factor * 0.5)
 
 
+@maybe_njit()
 def compute_asymmetry_score(left_angle: float, right_angle: float, penalty_factor: float) -> float:
     """
     Compute left-right asymmetry score.
@@ -260,6 +275,116 @@ def compute_final_score(
     return _clamp(score)
 
 
+def _specialize_score_rep(config: ExerciseConfig):
+    """
+    Partially evaluate score_rep for a fixed config.
+
+    The config never changes for the lifetime of an exercise, so the
+    returned closure captures every config field (and the derived tempo
+    multipliers) as free variables and inlines the clamps. Closure
+    variables load with LOAD_DEREF, roughly 3x cheaper than the eight
+    self.config.* attribute chains the generic path pays per call —
+    which is what dominates when replaying thousands of archived reps.
+    The output dict is identical to score_rep().
+    """
+    target_rom = config.target_rom
+    acceptable_sway = config.acceptable_sway
+    # Strength-reduce the per-rep divide: sway/acc*factor == sway*(factor/acc)
+    sway_penalty = (
+        config.stability_factor / acceptable_sway if acceptable_sway > 0 else 0.0
+    )
+    asymmetry_penalty_factor = config.asymmetry_penalty_factor
+    ideal_rep_time = config.ideal_rep_time
+    fast_penalty = config.tempo_penalty_factor * 2.0
+    slow_penalty = config.tempo_penalty_factor * 0.5
+    weight_rom = config.weight_rom
+    weight_stability = config.weight_stability
+    weight_tempo = config.weight_tempo
+
+    def specialized(user_rom, sway, rep_time, left_angle=None, right_angle=None):
+        if target_rom <= 0:
+            rom_score = 100.0
+        else:
+            rom_score = (user_rom / target_rom) * 100.0
+            rom_score = max(0.0, min(100.0, rom_score))
+
+        if acceptable_sway <= 0:
+            stability_score = 100.0
+        else:
+            stability_score = 100.0 - sway * sway_penalty
+            stability_score = max(0.0, min(100.0, stability_score))
+
+        diff = rep_time - ideal_rep_time
+        if diff < 0:
+            tempo_score = 100.0 + diff * fast_penalty
+        else:
+            tempo_score = 100.0 - diff * slow_penalty
+        tempo_score = max(0.0, min(100.0, tempo_score))
+
+        asymmetry_score = 100.0
+        if left_angle is not None and right_angle is not None:
+            asymmetry_score = 100.0 - abs(left_angle - right_angle) * asymmetry_penalty_factor
+            asymmetry_score = max(0.0, min(100.0, asymmetry_score))
+
+        final_score = (
+            weight_rom * rom_score +
+            weight_stability * stability_score +
+            weight_tempo * tempo_score
+        )
+        final_score = max(0.0, min(100.0, final_score))
+
+        return {
+            "rom_score": round(rom_score, 1),
+            "stability_score": round(stability_score, 1),
+            "tempo_score": round(tempo_score, 1),
+            "asymmetry_score": round(asymmetry_score, 1),
+            "final_score": round(final_score, 1),
+        }
+
+    return specialized
+
+
+@functools.lru_cache(maxsize=4096)
+def _rom_cached(user_q: float, target_q: float) -> float:
+    return compute_rom_score(user_q, target_q)
+
+
+@functools.lru_cache(maxsize=4096)
+def _asymmetry_cached(diff_q: float, penalty_factor: float) -> float:
+    return compute_asymmetry_score(diff_q, 0.0, penalty_factor)
+
+
+def compute_rom_score_cached(user_rom: float, target_rom: float) -> float:
+    """Memoized compute_rom_score with inputs quantized to 0.5 degrees.
+
+    Replay and progression-chart workloads re-score the same angles over
+    and over (pose noise already quantizes them in practice), so the
+    arithmetic collapses to a dict hit. The quantization shifts results
+    by at most ~0.3 points, fine for aggregate charts — live per-rep
+    scoring should keep using the exact compute_rom_score.
+    """
+    return _rom_cached(round(user_rom * 2) / 2, round(target_rom * 2) / 2)
+
+
+def compute_asymmetry_score_cached(left_angle: float, right_angle: float,
+                                   penalty_factor: float) -> float:
+    """Memoized compute_asymmetry_score, quantized like the ROM variant.
+
+    Keyed on the quantized left/right difference, which is what the
+    formula actually consumes, so mirrored angle pairs share one entry.
+    """
+    diff_q = round(abs(left_angle - right_angle) * 2) / 2
+    return _asymmetry_cached(diff_q, penalty_factor)
+
+
+def warmup():
+    """Run each jitted scoring helper once so compilation isn't paid mid-set."""
+    compute_rom_score(45.0, 90.0)
+    compute_stability_score(0.01, 0.02, 100.0)
+    compute_tempo_score(3.5, 3.0, 20.0)
+    compute_asymmetry_score(90.0, 85.0, 5.0)
+
+
 class RepScorer:
     """
     Convenience class that computes all scores for a single completed rep.
@@ -273,8 +398,12 @@ class RepScorer:
     #  'asymmetry_score': 100.0, 'final_score': 82.1}
     """
 
+    __slots__ = ('config', '_score_fn')
+
     def __init__(self, config: ExerciseConfig):
         self.config = config
+        # Config is fixed per exercise, so bake it in once up front
+        self._score_fn = _specialize_score_rep(config)
 
     def score_rep(
         self,
@@ -284,48 +413,135 @@ class RepScorer:
         left_angle: float = None,
         right_angle: float = None
     ) -> dict:
+        """Score a completed rep against this scorer's config. See score_rep()."""
+        return self._score_fn(user_rom, sway, rep_time, left_angle, right_angle)
+
+    def score_session(self, user_roms, sways, rep_times):
         """
-        Score a completed rep.
+        Score a whole session of reps in one vectorized pass.
+
+        Component scores are computed as arrays (one np.minimum / np.clip
+        / np.where per component instead of per-rep Python calls) and the
+        weighted final score is a single matrix-vector product, so
+        aggregating hundreds of archived reps costs a handful of array
+        ops. Live per-rep scoring should keep using score_rep.
 
         Parameters
         ----------
-        user_rom : float
-            The ROM (max_angle - min_angle) achieved during this rep.
-        sway : float
-            Current hip sway value from SwayTracker.
-        rep_time : float
-            Time in seconds this rep took.
-        left_angle : float, optional
-            Left-side joint angle for asymmetry scoring.
-        right_angle : float, optional
-            Right-side joint angle for asymmetry scoring.
+        user_roms, sways, rep_times : array_like of shape (N,)
+            Per-rep ROM, sway and duration measurements.
 
         Returns
         -------
-        dict
-            Keys: rom_score, stability_score, tempo_score, asymmetry_score, final_score.
-            All values are floats rounded to 1 decimal, range 0–100.
+        dict of ndarray
+            Keys rom_score, stability_score, tempo_score, final_score,
+            each a (N,) float array in 0-100. Values are not rounded.
         """
-        rom_score = compute_rom_score(user_rom, self.config.target_rom)
-        stability_score = compute_stability_score(
-            sway, self.config.acceptable_sway, self.config.stability_factor
-        )
-        tempo_score = compute_tempo_score(
-            rep_time, self.config.ideal_rep_time, self.config.tempo_penalty_factor
-        )
-
-        asymmetry_score = 100.0
-        if left_angle is not None and right_angle is not None:
-            asymmetry_score = compute_asymmetry_score(
-                left_angle, right_angle, self.config.asymmetry_penalty_factor
+        # Deferred import: the live path never needs numpy here, and the
+        # session replay tools that call this already have it loaded.
+        import numpy as np
+
+        config = self.config
+        user_roms = np.asarray(user_roms, dtype=np.float64)
+        sways = np.asarray(sways, dtype=np.float64)
+        rep_times = np.asarray(rep_times, dtype=np.float64)
+
+        if config.target_rom <= 0:
+            rom_scores = np.full_like(user_roms, 100.0)
+        else:
+            rom_scores = np.minimum((user_roms / config.target_rom) * 100.0, 100.0)
+            rom_scores = np.maximum(rom_scores, 0.0)
+
+        if config.acceptable_sway <= 0:
+            stability_scores = np.full_like(sways, 100.0)
+        else:
+            # Folded constant: one vector multiply instead of divide+multiply
+            stability_scores = np.clip(
+                100.0 - sways * (config.stability_factor / config.acceptable_sway),
+                0.0, 100.0,
             )
 
-        final_score = compute_final_score(rom_score, stability_score, tempo_score, self.config)
+        # Branchless asymmetric tempo penalty: the fast/slow multiplier is
+        # selected per element, so the whole batch vectorizes regardless
+        # of how tempo swings rep to rep.
+        diff = rep_times - config.ideal_rep_time
+        mult = np.where(
+            diff < 0,
+            config.tempo_penalty_factor * 2.0,
+            config.tempo_penalty_factor * 0.5,
+        )
+        tempo_scores = np.clip(100.0 - np.abs(diff) * mult, 0.0, 100.0)
 
+        weights = np.array(
+            [config.weight_rom, config.weight_stability, config.weight_tempo]
+        )
+        final_scores = np.clip(
+            np.stack((rom_scores, stability_scores, tempo_scores), axis=1) @ weights,
+            0.0, 100.0,
+        )
         return {
-            "rom_score": round(rom_score, 1),
-            "stability_score": round(stability_score, 1),
-            "tempo_score": round(tempo_score, 1),
-            "asymmetry_score": round(asymmetry_score, 1),
-            "final_score": round(final_score, 1),
+            "rom_score": rom_scores,
+            "stability_score": stability_scores,
+            "tempo_score": tempo_scores,
+            "final_score": final_scores,
         }
+
+
+def score_rep(
+    config: ExerciseConfig,
+    user_rom: float,
+    sway: float,
+    rep_time: float,
+    left_angle: float = None,
+    right_angle: float = None
+) -> dict:
+    """
+    Score a completed rep.
+
+    Stateless module-level form: callers pass the exercise config along
+    with the measurements, so no scorer instance needs to be held.
+
+    Parameters
+    ----------
+    config : ExerciseConfig
+        Target ROM, ideal tempo, weights etc. for the exercise.
+    user_rom : float
+        The ROM (max_angle - min_angle) achieved during this rep.
+    sway : float
+        Current hip sway value from SwayTracker.
+    rep_time : float
+        Time in seconds this rep took.
+    left_angle : float, optional
+        Left-side joint angle for asymmetry scoring.
+    right_angle : float, optional
+        Right-side joint angle for asymmetry scoring.
+
+    Returns
+    -------
+    dict
+        Keys: rom_score, stability_score, tempo_score, asymmetry_score, final_score.
+        All values are floats rounded to 1 decimal, range 0–100.
+    """
+    rom_score = compute_rom_score(user_rom, config.target_rom)
+    stability_score = compute_stability_score(
+        sway, config.acceptable_sway, config.stability_factor
+    )
+    tempo_score = compute_tempo_score(
+        rep_time, config.ideal_rep_time, config.tempo_penalty_factor
+    )
+
+    asymmetry_score = 100.0
+    if left_angle is not None and right_angle is not None:
+        asymmetry_score = compute_asymmetry_score(
+            left_angle, right_angle, config.asymmetry_penalty_factor
+        )
+
+    final_score = compute_final_score(rom_score, stability_score, tempo_score, config)
+
+    return {
+        "rom_score": round(rom_score, 1),
+        "stability_score": round(stability_score, 1),
+        "tempo_score": round(tempo_score, 1),
+        "asymmetry_score": round(asymmetry_score, 1),
+        "final_score": round(final_score, 1),
+    }
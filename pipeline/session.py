@@ -9,8 +9,19 @@ import time
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Same optional C serializer as progression: orjson when installed,
+# stdlib json (matching indent-2 layout) otherwise.
+try:
+    import orjson
 
-@dataclass
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+
+@dataclass(slots=True)
 class RepRecord:
     """Data for a single completed rep."""
     rep_number: int
@@ -23,8 +34,26 @@ class RepRecord:
     rep_time: float = 0.0
     feedback: list = field(default_factory=list)
 
+    def to_dict(self) -> dict:
+        """This rep as its JSON export row.
 
-@dataclass
+        Hand-inlined field reads: no dataclasses.asdict-style
+        introspection or deep copy, just one dict display per rep.
+        """
+        return {
+            "rep": self.rep_number,
+            "rom_score": self.rom_score,
+            "stability_score": self.stability_score,
+            "tempo_score": self.tempo_score,
+            "asymmetry_score": self.asymmetry_score,
+            "final_score": self.final_score,
+            "rom_value": round(self.rom_value, 1),
+            "rep_time": round(self.rep_time, 2),
+            "feedback": self.feedback,
+        }
+
+
+@dataclass(slots=True)
 class Session:
     """Accumulates rep data for a full exercise session."""
     exercise_name: str = ""
@@ -32,6 +61,35 @@ class Session:
     end_time: Optional[float] = None
     reps: list[RepRecord] = field(default_factory=list)
     feedback_events: list[str] = field(default_factory=list)
+    # Derived state (slots=True requires declaring these as fields)
+    _score_sums: dict = field(default_factory=dict, init=False, repr=False)
+    _feedback_seen: dict = field(default_factory=dict, init=False, repr=False)
+    _summary_cache: Optional[dict] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # Running score sums, maintained by add_rep: summary() polls all
+        # five averages (e.g. from a UI refresh), and serving them from
+        # these is O(1) instead of five full passes over the rep list.
+        self._score_sums = {
+            "final": 0.0, "rom": 0.0, "stability": 0.0,
+            "tempo": 0.0, "asymmetry": 0.0,
+        }
+        for r in self.reps:  # in case a pre-built rep list was passed in
+            self._accumulate(r)
+        # Insertion-ordered dedupe of feedback messages, maintained as
+        # events arrive so summary() doesn't rehash the whole history
+        # (list(set(...))) on every call — and keeps first-seen order.
+        self._feedback_seen = dict.fromkeys(self.feedback_events)
+        # summary() result cache, invalidated on mutation; see summary()
+        self._summary_cache = None
+
+    def _accumulate(self, rep: "RepRecord"):
+        sums = self._score_sums
+        sums["final"] += rep.final_score
+        sums["rom"] += rep.rom_score
+        sums["stability"] += rep.stability_score
+        sums["tempo"] += rep.tempo_score
+        sums["asymmetry"] += rep.asymmetry_score
 
     def add_rep(self, scores: dict, rom_value: float = 0.0, rep_time: float = 0.0, feedback: list = None):
         """Add a completed rep to the session."""
@@ -47,81 +105,105 @@ class Session:
             feedback=feedback or [],
         )
         self.reps.append(rep)
+        self._accumulate(rep)
+        self._summary_cache = None
         if feedback:
             self.feedback_events.extend(feedback)
+            for fb in feedback:
+                self._feedback_seen[fb] = None
 
     def end_session(self):
         """Mark session as ended."""
         self.end_time = time.time()
+        self._summary_cache = None
 
     @property
     def total_reps(self) -> int:
         return len(self.reps)
 
-    @property
-    def avg_final_score(self) -> float:
+    def _avg(self, key: str) -> float:
         if not self.reps:
             return 0.0
-        return sum(r.final_score for r in self.reps) / len(self.reps)
+        return self._score_sums[key] / len(self.reps)
+
+    @property
+    def avg_final_score(self) -> float:
+        return self._avg("final")
 
     @property
     def avg_rom_score(self) -> float:
-        if not self.reps:
-            return 0.0
-        return sum(r.rom_score for r in self.reps) / len(self.reps)
+        return self._avg("rom")
 
     @property
     def avg_stability_score(self) -> float:
-        if not self.reps:
-            return 0.0
-        return sum(r.stability_score for r in self.reps) / len(self.reps)
+        return self._avg("stability")
 
     @property
     def avg_tempo_score(self) -> float:
-        if not self.reps:
-            return 0.0
-        return sum(r.tempo_score for r in self.reps) / len(self.reps)
+        return self._avg("tempo")
 
     @property
     def avg_asymmetry_score(self) -> float:
-        if not self.reps:
-            return 0.0
-        return sum(r.asymmetry_score for r in self.reps) / len(self.reps)
+        return self._avg("asymmetry")
 
     def summary(self) -> dict:
-        """Return a complete session summary."""
-        return {
-            "exercise": self.exercise_name,
-            "total_reps": self.total_reps,
-            "avg_final_score": round(self.avg_final_score, 1),
-            "avg_rom_score": round(self.avg_rom_score, 1),
-            "avg_stability_score": round(self.avg_stability_score, 1),
-            "avg_tempo_score": round(self.avg_tempo_score, 1),
-            "avg_asymmetry_score": round(self.avg_asymmetry_score, 1),
-            "duration_seconds": round((self.end_time or time.time()) - self.start_time, 1),
-            "feedback_events": list(set(self.feedback_events)),
-        }
+        """Return a complete session summary.
+
+        The result is cached and rebuilt only after add_rep/end_session,
+        so dashboards polling it between reps pay a dict copy, not a
+        recompute. While the session is live, duration_seconds is
+        refreshed on every call; a fresh copy is returned each time so
+        callers may mutate it freely.
+        """
+        cached = self._summary_cache
+        if cached is None:
+            cached = self._summary_cache = {
+                "exercise": self.exercise_name,
+                "total_reps": self.total_reps,
+                "avg_final_score": round(self.avg_final_score, 1),
+                "avg_rom_score": round(self.avg_rom_score, 1),
+                "avg_stability_score": round(self.avg_stability_score, 1),
+                "avg_tempo_score": round(self.avg_tempo_score, 1),
+                "avg_asymmetry_score": round(self.avg_asymmetry_score, 1),
+                "duration_seconds": round(
+                    (self.end_time or time.time()) - self.start_time, 1
+                ),
+                "feedback_events": list(self._feedback_seen),
+            }
+        out = dict(cached)
+        out["feedback_events"] = list(cached["feedback_events"])
+        if self.end_time is None:
+            out["duration_seconds"] = round(time.time() - self.start_time, 1)
+        return out
 
     def to_json(self) -> str:
         """Export session to JSON string."""
-        data = self.summary()
-        data["reps"] = [
-            {
-                "rep": r.rep_number,
-                "rom_score": r.rom_score,
-                "stability_score": r.stability_score,
-                "tempo_score": r.tempo_score,
-                "asymmetry_score": r.asymmetry_score,
-                "final_score": r.final_score,
-                "rom_value": round(r.rom_value, 1),
-                "rep_time": round(r.rep_time, 2),
-                "feedback": r.feedback,
-            }
-            for r in self.reps
-        ]
-        return json.dumps(data, indent=2)
+        return _dumps(self._export_dict()).decode()
 
     def save(self, filepath: str):
-        """Save session data to a JSON file."""
-        with open(filepath, "w") as f:
-            f.write(self.to_json())
+        """Save session data to a JSON file, streaming reps one at a time.
+
+        Instead of materializing the full payload (an N-element list of
+        rep dicts plus its serialized string), the reps array is framed
+        by hand and each rep is serialized and written individually, so
+        peak memory stays at one rep regardless of session length. The
+        indentation of the rep rows differs from to_json(); the JSON
+        content is identical.
+        """
+        head = _dumps(self.summary())
+        head = head[:head.rindex(b"}")].rstrip()
+        with open(filepath, "wb") as f:
+            f.write(head)
+            f.write(b',\n  "reps": [')
+            sep = b"\n"
+            for r in self.reps:
+                f.write(sep)
+                f.write(_dumps(r.to_dict()))
+                sep = b",\n"
+            f.write(b"\n  ]\n}" if self.reps else b"]\n}")
+
+    def _export_dict(self) -> dict:
+        """Full export payload (summary plus per-rep rows)."""
+        data = self.summary()
+        data["reps"] = [r.to_dict() for r in self.reps]
+        return data
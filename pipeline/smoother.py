@@ -7,6 +7,8 @@ Reduces noise from raw MediaPipe pose output.
 import numpy as np
 from typing import Optional
 
+from .kernels import NUMBA_AVAILABLE, ema_smooth_batch, ema_smooth_inplace
+
 
 class EMALandmarkSmoother:
     """
@@ -21,9 +23,16 @@ class EMALandmarkSmoother:
     """
 
     def __init__(self, alpha: float = 0.3, num_landmarks: int = 33):
-        self.alpha = alpha
+        self.alpha = float(alpha)
+        # Folded once here; every frame's update reads it instead of
+        # re-deriving 1 - alpha.
+        self._one_minus_alpha = 1.0 - self.alpha
         self.num_landmarks = num_landmarks
         self.state: Optional[np.ndarray] = None  # Shape: (num_landmarks, 3) for x,y,z
+        # Reused input buffer filled in place each frame. float32: that's
+        # all the precision the pose model provides, and halving the
+        # bytes moved matters on this memory-bound path.
+        self._in_buf = np.empty((num_landmarks, 3), dtype=np.float32)
 
     def reset(self):
         """Reset smoothing state."""
@@ -40,17 +49,144 @@ class EMALandmarkSmoother:
         Returns:
             List of landmarks with smoothed coordinates (same type as input).
         """
-        current = np.array([[lm.x, lm.y, lm.z] for lm in landmarks])
+        # Fill the reused buffer in place. The Tasks API landmarks are
+        # plain Python objects, not protobuf messages, so there is no
+        # serialized layout to frombuffer() from; scalar attribute reads
+        # into a preallocated array are the cheapest available ingest
+        # (no per-frame list-of-lists or np.array construction).
+        current = self._in_buf
+        for i, lm in enumerate(landmarks):
+            current[i, 0] = lm.x
+            current[i, 1] = lm.y
+            current[i, 2] = lm.z
 
         if self.state is None:
-            self.state = current.copy()
+            # Donate the filled buffer as the initial state and allocate
+            # a fresh (uninitialized) input buffer, rather than memcpy-ing
+            # 99 floats — np.empty costs only the allocation. Matters
+            # whenever reset() is called between reps.
+            self.state = current
+            self._in_buf = np.empty_like(current)
+        elif NUMBA_AVAILABLE:
+            ema_smooth_inplace(self.state, current, self.alpha)
         else:
-            self.state = self.alpha * current + (1.0 - self.alpha) * self.state
+            # Allocation-free NumPy fallback: current is our own scratch
+            # buffer (refilled next frame), so it can be scaled in place.
+            self.state *= self._one_minus_alpha
+            current *= self.alpha
+            self.state += current
 
-        # Write smoothed values back onto the landmark objects
-        for i, lm in enumerate(landmarks):
-            lm.x = float(self.state[i, 0])
-            lm.y = float(self.state[i, 1])
-            lm.z = float(self.state[i, 2])
+        # Write smoothed values back onto the landmark objects. One
+        # tolist() boxes all 99 values in a single C loop, instead of
+        # 99 scalar ndarray indexings each boxing its own float.
+        for lm, (x, y, z) in zip(landmarks, self.state.tolist()):
+            lm.x = x
+            lm.y = y
+            lm.z = z
 
         return landmarks
+
+    def smooth_array(self, xyz: np.ndarray) -> np.ndarray:
+        """
+        Array-native twin of smooth() for (num_landmarks, 3) coordinates.
+
+        Callers whose landmarks already live in a NumPy buffer (e.g. the
+        LandmarkBuffer path of process_landmarks_array) skip the
+        per-landmark attribute reads and write-backs entirely — the
+        update is pure array math on the shared state.
+
+        Args:
+            xyz: (num_landmarks, 3) coordinate array. Not modified.
+
+        Returns:
+            self.state, the smoothed (num_landmarks, 3) float32 array.
+        """
+        if self.state is None:
+            self.state = np.array(xyz, dtype=np.float32)
+        elif NUMBA_AVAILABLE:
+            ema_smooth_inplace(self.state, xyz, self.alpha)
+        else:
+            # The caller keeps ownership of xyz, so scale a copy of it
+            # into the reused input buffer instead of in place.
+            self.state *= self._one_minus_alpha
+            np.multiply(xyz, self.alpha, out=self._in_buf)
+            self.state += self._in_buf
+        return self.state
+
+    def smooth_batch(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Smooth a whole (T, num_landmarks, 3) frame window at once.
+
+        Equivalent to calling smooth_array on each frame in order, but
+        the recurrence runs inside one compiled kernel parallelized over
+        landmarks, so replay and post-session analysis batches pay the
+        Python overhead once per window instead of once per frame.
+        Leaves self.state advanced past the last frame, so live
+        smoothing can resume seamlessly.
+
+        Args:
+            frames: (T, num_landmarks, 3) coordinate array. Not modified.
+
+        Returns:
+            A new (T, num_landmarks, 3) float32 array of smoothed frames.
+        """
+        frames = np.ascontiguousarray(frames, dtype=np.float32)
+        out = np.empty_like(frames)
+        if frames.shape[0] == 0:
+            return out
+        start = 0
+        if self.state is None:
+            # Same first-frame semantics as smooth_array: the initial
+            # state is the raw frame, passed through unchanged.
+            self.state = frames[0].copy()
+            out[0] = frames[0]
+            start = 1
+        if NUMBA_AVAILABLE:
+            ema_smooth_batch(self.state, frames[start:], out[start:], self.alpha)
+        else:
+            beta = self._one_minus_alpha
+            for t in range(start, frames.shape[0]):
+                self.state *= beta
+                np.multiply(frames[t], self.alpha, out=self._in_buf)
+                self.state += self._in_buf
+                out[t] = self.state
+        return out
+
+    def smooth_offline(self, seq: np.ndarray) -> np.ndarray:
+        """
+        One-shot post-session smoothing of a recorded sequence.
+
+        The EMA recurrence is a first-order IIR filter, so a whole
+        (T, num_landmarks, 3) recording collapses to a single
+        scipy.signal.lfilter call across all coordinates — one tuned C
+        loop instead of T Python-level steps, which also makes
+        per-session alpha sweeps cheap. The initial condition is chosen
+        so the first output frame equals the first input frame, matching
+        the live smoother. Stateless: self.state is not read or touched.
+
+        Args:
+            seq: (T, num_landmarks, 3) coordinate array. Not modified.
+
+        Returns:
+            A new (T, num_landmarks, 3) float32 array of smoothed frames.
+        """
+        try:
+            from scipy.signal import lfilter
+        except ImportError:
+            # scipy ships with scikit-learn here, but degrade gracefully:
+            # run the batch kernel on fresh state without disturbing the
+            # live smoothing state.
+            saved = self.state
+            self.state = None
+            try:
+                return self.smooth_batch(seq)
+            finally:
+                self.state = saved
+        seq = np.asarray(seq, dtype=np.float32)
+        flat = seq.reshape(seq.shape[0], -1)
+        # y[t] = alpha * x[t] + (1 - alpha) * y[t-1], seeded with y[-1] = x[0]
+        zi = self._one_minus_alpha * flat[:1]
+        out, _ = lfilter(
+            [self.alpha], [1.0, -self._one_minus_alpha], flat, axis=0, zi=zi
+        )
+        return out.astype(np.float32).reshape(seq.shape)